@@ -22,7 +22,6 @@ Environment Variables:
     STT_LANGUAGE: Preferred language for speech recognition
 """
 
-import os
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
@@ -31,8 +30,6 @@ from dotenv import load_dotenv
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from echomind.ui.gradio_app import create_interface
-from echomind.config import settings
 from loguru import logger
 
 
@@ -59,6 +56,11 @@ def main() -> None:
     
     Initializes the environment, sets up logging, and launches the Gradio interface.
     """
+    # Imported here rather than at module level: the TTS worker is a spawned
+    # process that re-imports this file as __mp_main__, and must not load gradio
+    from echomind.ui.gradio_app import create_interface
+    from echomind.config import settings
+    
     # Load environment variables from .env file
     load_dotenv()
     
@@ -0,0 +1,127 @@
+"""
+Dynamic Request Batching
+=======================
+
+This module provides an asyncio-based dynamic batcher for the EchoMind-NLP assistant.
+Requests that arrive close together are grouped and handed to a blocking batch
+function in a worker thread, so model backends can run at batch size > 1.
+
+Features:
+- Bounded batch size and collection window
+- Blocking batch functions run off the event loop
+- Per-request futures; a failed batch fails only its own requests
+"""
+
+import asyncio
+from typing import Any, Callable, List, Optional, Tuple
+from loguru import logger
+
+
+class AsyncBatcher:
+    """
+    Groups concurrent requests into batches for a blocking batch function.
+
+    The first request of a batch opens a collection window of ``max_wait_ms``;
+    requests arriving within it (up to ``max_batch_size``) are processed together.
+    While a batch is running, new requests queue up and form the next batch.
+
+    Attributes:
+        process_batch: Callable mapping a list of inputs to a list of outputs in the same order
+        max_batch_size: Maximum number of requests per batch
+        max_wait_ms: Collection window in milliseconds after the first request arrives
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = 4,
+        max_wait_ms: float = 20.0,
+    ) -> None:
+        """
+        Initialize the batcher.
+
+        Args:
+            process_batch: Blocking function processing a list of inputs
+            max_batch_size: Maximum number of requests per batch
+            max_wait_ms: Collection window in milliseconds
+        """
+        self.process_batch = process_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max_wait_ms
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Submit one request and wait for its result.
+
+        Args:
+            item: Input for the batch function
+
+        Returns:
+            The batch function's output for this input
+        """
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    def _ensure_worker(self) -> None:
+        """
+        Start the worker task on the running loop if it is not running there.
+
+        The queue and worker belong to one event loop; when called from a
+        different loop (e.g. a later ``asyncio.run``), both are recreated on it.
+        A previous worker keeps draining its own queue on its own loop.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run(self._queue))
+
+    async def _run(self, queue: asyncio.Queue) -> None:
+        """
+        Collect requests into batches and dispatch them forever.
+
+        Args:
+            queue: Request queue of the loop this worker runs on
+        """
+        loop = asyncio.get_running_loop()
+        window = self.max_wait_ms / 1000.0
+
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + window
+
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._dispatch(batch)
+
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        """Run the batch function in a thread and resolve each request's future."""
+        items = [item for item, _ in batch]
+
+        try:
+            results = await asyncio.to_thread(self.process_batch, items)
+            if len(results) != len(items):
+                raise RuntimeError(f"Batch function returned {len(results)} results for {len(items)} inputs")
+        except Exception as e:
+            logger.error(f"Batch of {len(items)} failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        logger.debug(f"Processed batch of {len(items)}")
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
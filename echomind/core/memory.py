@@ -12,24 +12,39 @@ Features:
 - Context window management
 """
 
+import threading
 from collections import deque
+from itertools import islice
 from typing import Deque, List, Tuple, Optional, Dict, Any
 from datetime import datetime
 import json
 
+from echomind.core.time_utils import iso_now
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class ConversationMemory:
     """
     Manages conversation history with a fixed-size rolling window.
     
-    This class maintains a deque of conversation turns, automatically
-    removing old entries when the maximum size is reached.
+    This class maintains parallel deques of user and assistant texts,
+    automatically removing old entries when the maximum size is reached.
     
     Attributes:
         max_turns: Maximum number of conversation turns to remember
-        _history: Internal deque storing (user_text, assistant_text) tuples
+        _users: Internal deque storing user texts
+        _assistants: Internal deque storing assistant texts, aligned with ``_users``
+        _cached_ctx: Formatted context strings keyed by ``max_turns``
+        _lock: Keeps ``_users``/``_assistants`` aligned and the cache consistent across threads
     """
     
+    __slots__ = ("max_turns", "_users", "_assistants", "_created_at", "_cached_ctx", "_lock")
+    
     def __init__(self, max_turns: int = 20) -> None:
         """
         Initialize conversation memory.
@@ -39,8 +54,11 @@ class ConversationMemory:
                       Older turns are automatically removed when exceeded.
         """
         self.max_turns = max_turns
-        self._history: Deque[Tuple[str, str]] = deque(maxlen=max_turns)
+        self._users: Deque[str] = deque(maxlen=max_turns)
+        self._assistants: Deque[str] = deque(maxlen=max_turns)
         self._created_at = datetime.now()
+        self._cached_ctx: Dict[Optional[int], str] = {}
+        self._lock = threading.Lock()
     
     def add_turn(self, user_text: str, assistant_text: str) -> None:
         """
@@ -53,7 +71,10 @@ class ConversationMemory:
         if not user_text.strip() or not assistant_text.strip():
             return  # Skip empty turns
         
-        self._history.append((user_text.strip(), assistant_text.strip()))
+        with self._lock:
+            self._users.append(user_text.strip())
+            self._assistants.append(assistant_text.strip())
+            self._cached_ctx.clear()
     
     def as_list(self) -> List[Tuple[str, str]]:
         """
@@ -62,7 +83,8 @@ class ConversationMemory:
         Returns:
             List of (user_text, assistant_text) tuples
         """
-        return list(self._history)
+        with self._lock:
+            return list(zip(self._users, self._assistants))
     
     def get_context(self, max_turns: Optional[int] = None) -> str:
         """
@@ -74,21 +96,26 @@ class ConversationMemory:
         Returns:
             Formatted conversation context string
         """
-        if not self._history:
-            return ""
-        
-        turns = self.as_list()
-        if max_turns:
-            turns = turns[-max_turns:]
-        
-        context_parts = []
-        for i, (user, assistant) in enumerate(turns, 1):
-            context_parts.append(f"Turn {i}:")
-            context_parts.append(f"User: {user}")
-            context_parts.append(f"Assistant: {assistant}")
-            context_parts.append("")
-        
-        return "\n".join(context_parts).strip()
+        with self._lock:
+            if not self._users:
+                return ""
+            
+            cached = self._cached_ctx.get(max_turns)
+            if cached is not None:
+                return cached
+            
+            users, assistants = self._users, self._assistants
+            if max_turns:
+                start = max(0, len(users) - max_turns)
+                users = islice(users, start, None)
+                assistants = islice(assistants, start, None)
+            
+            context = "\n".join(
+                f"Turn {i}:\nUser: {user}\nAssistant: {assistant}\n"
+                for i, (user, assistant) in enumerate(zip(users, assistants), 1)
+            ).strip()
+            self._cached_ctx[max_turns] = context
+            return context
     
     def get_recent_context(self, turns: int = 3) -> str:
         """
@@ -104,7 +131,10 @@ class ConversationMemory:
     
     def clear(self) -> None:
         """Clear all conversation history."""
-        self._history.clear()
+        with self._lock:
+            self._users.clear()
+            self._assistants.clear()
+            self._cached_ctx.clear()
     
     def is_empty(self) -> bool:
         """
@@ -113,7 +143,7 @@ class ConversationMemory:
         Returns:
             True if no conversation turns are stored
         """
-        return len(self._history) == 0
+        return len(self._users) == 0
     
     def count(self) -> int:
         """
@@ -122,7 +152,7 @@ class ConversationMemory:
         Returns:
             Number of turns in memory
         """
-        return len(self._history)
+        return len(self._users)
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -136,7 +166,7 @@ class ConversationMemory:
             "turns": self.as_list(),
             "count": self.count(),
             "created_at": self._created_at.isoformat(),
-            "last_updated": datetime.now().isoformat()
+            "last_updated": iso_now()
         }
     
     def from_dict(self, data: Dict[str, Any]) -> None:
@@ -146,8 +176,12 @@ class ConversationMemory:
         Args:
             data: Dictionary containing conversation memory data
         """
-        self.max_turns = data.get("max_turns", 20)
-        self._history = deque(data.get("turns", []), maxlen=self.max_turns)
+        turns = data.get("turns", [])
+        with self._lock:
+            self.max_turns = data.get("max_turns", 20)
+            self._users = deque((user for user, _ in turns), maxlen=self.max_turns)
+            self._assistants = deque((assistant for _, assistant in turns), maxlen=self.max_turns)
+            self._cached_ctx.clear()
         self._created_at = datetime.fromisoformat(data.get("created_at", datetime.now().isoformat()))
     
     def save_to_file(self, filepath: str) -> None:
@@ -157,8 +191,13 @@ class ConversationMemory:
         Args:
             filepath: Path to save the conversation memory
         """
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        if ORJSON_AVAILABLE:
+            # orjson encodes straight to UTF-8 bytes
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
     
     def load_from_file(self, filepath: str) -> None:
         """
@@ -167,8 +206,12 @@ class ConversationMemory:
         Args:
             filepath: Path to load the conversation memory from
         """
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if ORJSON_AVAILABLE:
+            with open(filepath, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         self.from_dict(data)
 
 
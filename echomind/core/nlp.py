@@ -18,10 +18,45 @@ Future Enhancements:
 - Intent classification and entity extraction
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 import re
-from datetime import datetime
-from loguru import logger
+from functools import lru_cache
+
+from echomind.core.time_utils import iso_now, now_str
+
+
+# Lexicons used by the basic sentiment analysis. Lookup is per token, so the
+# cost of a scan does not grow with the size of the lexicons.
+POSITIVE_WORDS = frozenset({"good", "great", "excellent", "amazing", "wonderful", "happy", "love", "like"})
+NEGATIVE_WORDS = frozenset({"bad", "terrible", "awful", "hate", "dislike", "sad", "angry", "frustrated"})
+
+_WORD_RE = re.compile(r"\w+")
+
+
+# Character classes hinting at each language, in the order hints are reported.
+# Several characters are shared (e.g. "é" is both Spanish and French).
+LANGUAGE_HINT_CLASSES = {
+    "russian": "а-яё",
+    "spanish": "ñáéíóúü",
+    "french": "àâäéèêëïîôöùûüÿç",
+    "german": "äöüß",
+}
+
+_LANGUAGE_CLASS_RES = {
+    lang: re.compile(f"[{chars}]", re.IGNORECASE)
+    for lang, chars in LANGUAGE_HINT_CLASSES.items()
+}
+
+# Union of every class so the text is scanned once per call
+_LANGUAGE_HINT_RE = re.compile(
+    "[" + "".join(LANGUAGE_HINT_CLASSES.values()) + "]", re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=256)
+def _char_languages(char: str) -> tuple:
+    """Languages whose hint class contains ``char``."""
+    return tuple(lang for lang, pattern in _LANGUAGE_CLASS_RES.items() if pattern.match(char))
 
 
 class NLPProcessor:
@@ -36,18 +71,16 @@ class NLPProcessor:
         response_templates: Templates for generating responses
     """
     
+    __slots__ = ("commands", "response_templates", "_response_suffixes", "_analyze_cached")
+    
     def __init__(self) -> None:
         """Initialize the NLP processor with commands and templates."""
+        # Keyed by bare command name; a single leading "/" is optional
         self.commands = {
-            "/help": self._handle_help,
             "help": self._handle_help,
-            "/clear": self._handle_clear,
             "clear": self._handle_clear,
-            "/status": self._handle_status,
             "status": self._handle_status,
-            "/time": self._handle_time,
             "time": self._handle_time,
-            "/echo": self._handle_echo,
             "echo": self._handle_echo,
         }
         
@@ -57,6 +90,22 @@ class NLPProcessor:
             "context_available": "I have context from our previous conversation to help provide better responses.",
             "command_processed": "Command processed successfully.",
         }
+        
+        # Echo-response suffix for every (has_context, prompt length class) pair
+        context_note = " " + self.response_templates["context_available"]
+        length_notes = {
+            "long": " That's quite a detailed message!",
+            "medium": "",
+            "short": " Short and sweet!",
+        }
+        self._response_suffixes = {
+            (has_context, length_class): (context_note if has_context else "") + note
+            for has_context in (False, True)
+            for length_class, note in length_notes.items()
+        }
+        
+        # Per-instance memo of the time-independent part of analyze()
+        self._analyze_cached = lru_cache(maxsize=512)(self._analyze_core)
     
     def generate(self, prompt: str, context: Optional[str] = None) -> str:
         """
@@ -75,12 +124,47 @@ class NLPProcessor:
             return self.response_templates["empty_input"]
         
         # Check for commands first
-        if self._is_command(cleaned_prompt):
-            return self._process_command(cleaned_prompt)
+        cleaned_lower = cleaned_prompt.lower()
+        if self._is_command(cleaned_lower):
+            return self._process_command(cleaned_lower)
         
         # Generate contextual response
         return self._generate_contextual_response(cleaned_prompt, context)
     
+    def generate_stream(self, prompt: str, context: Optional[str] = None) -> Iterator[str]:
+        """
+        Generate a response as a stream of text deltas.
+        
+        The rule-based generator builds the whole reply at once, so it is
+        yielded as a single delta; model-backed generators can override this
+        to yield tokens as they are produced.
+        
+        Args:
+            prompt: User's input text
+            context: Optional conversation context from previous turns
+        
+        Yields:
+            Successive pieces of the response text
+        """
+        yield self.generate(prompt, context=context)
+    
+    def generate_batch(self, prompts: List[str], context: Optional[str] = None) -> List[str]:
+        """
+        Generate responses for several prompts sharing the same context.
+        
+        The rule-based generator answers each prompt in turn; model-backed
+        generators can override this to run all prompts as one batched
+        inference call.
+        
+        Args:
+            prompts: User input texts
+            context: Optional conversation context shared by all prompts
+        
+        Returns:
+            One response per prompt, in the same order
+        """
+        return [self.generate(prompt, context=context) for prompt in prompts]
+    
     def analyze(self, text: str) -> Dict[str, Any]:
         """
         Analyze text and extract useful information.
@@ -91,38 +175,44 @@ class NLPProcessor:
         Returns:
             Dictionary containing analysis results
         """
-        cleaned_text = text.strip()
+        analysis = dict(self._analyze_cached(text.strip()))
+        analysis["language_hints"] = list(analysis["language_hints"])
+        analysis["timestamp"] = iso_now()
+        
+        return analysis
+    
+    def _analyze_core(self, cleaned_text: str) -> Dict[str, Any]:
+        """
+        Compute the cacheable part of :meth:`analyze`.
         
-        analysis = {
+        Results are memoized per input, so callers must copy before mutating.
+        """
+        lowercase = cleaned_text.lower()
+        return {
             "length": len(cleaned_text),
             "word_count": len(cleaned_text.split()),
             "character_count": len(cleaned_text),
             "is_empty": not bool(cleaned_text),
-            "is_command": self._is_command(cleaned_text),
+            "is_command": self._is_command(lowercase),
             "has_question": "?" in cleaned_text,
             "has_exclamation": "!" in cleaned_text,
-            "lowercase": cleaned_text.lower(),
-            "timestamp": datetime.now().isoformat(),
+            "lowercase": lowercase,
+            # Add sentiment analysis (basic)
+            "sentiment": self._analyze_sentiment(cleaned_text),
+            # Add language detection hints
+            "language_hints": tuple(self._detect_language_hints(cleaned_text)),
         }
-        
-        # Add sentiment analysis (basic)
-        analysis["sentiment"] = self._analyze_sentiment(cleaned_text)
-        
-        # Add language detection hints
-        analysis["language_hints"] = self._detect_language_hints(cleaned_text)
-        
-        return analysis
     
-    def _is_command(self, text: str) -> bool:
-        """Check if text is a recognized command."""
-        return text.lower() in self.commands
+    def _is_command(self, text_lower: str) -> bool:
+        """Check if already-lowercased text is a recognized command."""
+        return text_lower.removeprefix("/") in self.commands
     
-    def _process_command(self, command: str) -> str:
-        """Process a recognized command."""
-        command_lower = command.lower()
-        if command_lower in self.commands:
-            return self.commands[command_lower]()
-        return f"Unknown command: {command}"
+    def _process_command(self, command_lower: str) -> str:
+        """Process a recognized command given in lowercase."""
+        handler = self.commands.get(command_lower.removeprefix("/"))
+        if handler is not None:
+            return handler()
+        return f"Unknown command: {command_lower}"
     
     def _generate_contextual_response(self, prompt: str, context: Optional[str] = None) -> str:
         """
@@ -135,29 +225,16 @@ class NLPProcessor:
         Returns:
             Contextual response
         """
-        # Basic echo response with context awareness
-        response_parts = [f"You said: \"{prompt}\""]
-        
-        if context:
-            response_parts.append(self.response_templates["context_available"])
-        
-        # Add some variety to responses
-        if len(prompt) > 50:
-            response_parts.append("That's quite a detailed message!")
-        elif len(prompt) < 10:
-            response_parts.append("Short and sweet!")
-        
-        return " ".join(response_parts)
+        # Basic echo response with context awareness and some variety by length
+        length = len(prompt)
+        length_class = "long" if length > 50 else "short" if length < 10 else "medium"
+        return f"You said: \"{prompt}\"" + self._response_suffixes[(bool(context), length_class)]
     
     def _analyze_sentiment(self, text: str) -> str:
         """Basic sentiment analysis."""
-        text_lower = text.lower()
-        
-        positive_words = ["good", "great", "excellent", "amazing", "wonderful", "happy", "love", "like"]
-        negative_words = ["bad", "terrible", "awful", "hate", "dislike", "sad", "angry", "frustrated"]
-        
-        positive_count = sum(1 for word in positive_words if word in text_lower)
-        negative_count = sum(1 for word in negative_words if word in text_lower)
+        tokens = _WORD_RE.findall(text.lower())
+        positive_count = sum(map(POSITIVE_WORDS.__contains__, tokens))
+        negative_count = sum(map(NEGATIVE_WORDS.__contains__, tokens))
         
         if positive_count > negative_count:
             return "positive"
@@ -168,19 +245,11 @@ class NLPProcessor:
     
     def _detect_language_hints(self, text: str) -> List[str]:
         """Detect language hints based on text patterns."""
-        hints = []
-        
-        # Basic language detection patterns
-        if re.search(r'[а-яё]', text, re.IGNORECASE):
-            hints.append("russian")
-        if re.search(r'[ñáéíóúü]', text, re.IGNORECASE):
-            hints.append("spanish")
-        if re.search(r'[àâäéèêëïîôöùûüÿç]', text, re.IGNORECASE):
-            hints.append("french")
-        if re.search(r'[äöüß]', text, re.IGNORECASE):
-            hints.append("german")
+        found = set()
+        for char in set(_LANGUAGE_HINT_RE.findall(text)):
+            found.update(_char_languages(char))
         
-        return hints
+        return [lang for lang in LANGUAGE_HINT_CLASSES if lang in found]
     
     # Command handlers
     def _handle_help(self) -> str:
@@ -214,11 +283,11 @@ class NLPProcessor:
     
     def _handle_status(self) -> str:
         """Handle status command."""
-        return f"EchoMind-NLP is running. Current time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        return f"EchoMind-NLP is running. Current time: {now_str()}"
     
     def _handle_time(self) -> str:
         """Handle time command."""
-        return f"Current time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        return f"Current time: {now_str()}"
     
     def _handle_echo(self) -> str:
         """Handle echo command."""
@@ -12,23 +12,50 @@ Responsibilities:
 - Provide conversation statistics and management
 """
 
-from typing import Optional, Dict, Any, List, Tuple
+import asyncio
+import importlib.util
+import threading
+from collections import deque
+from typing import Optional, Dict, Any, Callable, List, Deque, AsyncIterable, AsyncIterator, Iterator, Tuple, Union, TYPE_CHECKING
 from datetime import datetime
 from loguru import logger
 
+from echomind.core.batcher import AsyncBatcher
 from echomind.core.memory import ConversationMemory
 from echomind.core.nlp import NLPProcessor
+from echomind.core.pipeline import VoicePipeline
 from echomind.config import settings
 
-# Import speech processing modules
-try:
-    from echomind.speech.stt_fasterwhisper import FasterWhisperSTT
-    from echomind.speech.tts_pyttsx3 import Pyttsx3TTS
-    from echomind.speech.audio_utils import AudioUtils
-    SPEECH_AVAILABLE = True
-except ImportError as e:
-    logger.warning(f"Speech modules not available: {e}")
-    SPEECH_AVAILABLE = False
+if TYPE_CHECKING:
+    import numpy as np
+    from echomind.speech.stt_base import STTProcessor
+    from echomind.speech.tts_base import TTSProcessor
+
+# Probe speech dependencies without importing them; the speech modules (and
+# their native libraries) are only loaded the first time voice is used.
+_SPEECH_DEPENDENCIES = ("numpy", "faster_whisper", "pyttsx3")
+_MISSING_SPEECH_DEPENDENCIES = [
+    name for name in _SPEECH_DEPENDENCIES if importlib.util.find_spec(name) is None
+]
+SPEECH_AVAILABLE = not _MISSING_SPEECH_DEPENDENCIES
+if not SPEECH_AVAILABLE:
+    logger.warning(f"Speech modules not available: missing {', '.join(_MISSING_SPEECH_DEPENDENCIES)}")
+
+# Number of recent turns passed to the NLP processor as context
+CONTEXT_TURNS = 3
+
+# Sample rate the speech-to-text engine expects for raw sample input
+STT_SAMPLE_RATE = 16000
+
+# Speech tuning settings, with defaults for a Settings class that doesn't define them
+WHISPER_COMPUTE_TYPE = getattr(settings, "whisper_compute_type", "int8")
+WHISPER_DEVICE = getattr(settings, "whisper_device", "auto")
+STT_MAX_BATCH = getattr(settings, "stt_max_batch", 4)
+STT_BATCH_TIMEOUT_MS = getattr(settings, "stt_batch_timeout_ms", 20.0)
+
+# Text requests arriving within this window (up to this many) share one generation call
+TEXT_MAX_BATCH = 8
+TEXT_BATCH_WAIT_MS = 50.0
 
 
 class AssistantOrchestrator:
@@ -43,6 +70,9 @@ class AssistantOrchestrator:
         nlp: Natural language processor
         conversation_start: Timestamp when conversation started
         total_turns: Total number of conversation turns processed
+        _recent_turns: Pre-formatted (unnumbered) text of the last few turns
+        _turn_lock: Serializes turn bookkeeping across request threads
+        _speech_processors: Created speech processors by name ("stt", "tts"); None if creation failed
     """
     
     def __init__(self) -> None:
@@ -56,26 +86,93 @@ class AssistantOrchestrator:
         self.nlp = NLPProcessor()
         self.conversation_start = datetime.now()
         self.total_turns = 0
+        self._recent_turns: Deque[str] = deque(maxlen=CONTEXT_TURNS)
+        self._turn_lock = threading.Lock()
         
-        # Initialize speech processing if available
-        self.stt_processor = None
-        self.tts_processor = None
+        # Speech processors are created lazily (see stt_processor / tts_processor)
         self.speech_enabled = SPEECH_AVAILABLE
+        self._speech_processors: Dict[str, Any] = {}
+        self._speech_lock = threading.Lock()
+        self.stt_batcher = None
+        
+        # Concurrent non-streaming requests (voice transcripts, handle_text_async)
+        # are answered together; the streaming chat path uses handle_text_stream
+        self.text_batcher = AsyncBatcher(
+            self.handle_text_batch,
+            max_batch_size=TEXT_MAX_BATCH,
+            max_wait_ms=TEXT_BATCH_WAIT_MS
+        )
         
         if self.speech_enabled:
-            try:
-                self.stt_processor = FasterWhisperSTT(
-                    model_size=settings.whisper_model_size,
-                    language=settings.stt_language
-                )
-                self.tts_processor = Pyttsx3TTS()
-                logger.info("Speech processing initialized")
-            except Exception as e:
-                logger.error(f"Failed to initialize speech processing: {e}")
-                self.speech_enabled = False
+            self.stt_batcher = AsyncBatcher(
+                self._transcribe_batch,
+                max_batch_size=STT_MAX_BATCH,
+                max_wait_ms=STT_BATCH_TIMEOUT_MS
+            )
         
         logger.info(f"Assistant orchestrator initialized (speech: {self.speech_enabled})")
     
+    @property
+    def stt_processor(self) -> Optional["STTProcessor"]:
+        """Speech-to-text processor, imported and created on first use."""
+        return self._speech_processor("stt", self._create_stt_processor)
+    
+    @property
+    def tts_processor(self) -> Optional["TTSProcessor"]:
+        """Text-to-speech processor, imported and created on first use."""
+        return self._speech_processor("tts", self._create_tts_processor)
+    
+    def _speech_processor(self, name: str, create: Callable[[], Any]) -> Optional[Any]:
+        """
+        Get a speech processor, creating it exactly once across threads.
+        
+        The warmup thread and request threads may ask for a processor at the
+        same time; the lock makes them share one instance.
+        
+        Args:
+            name: Key in ``_speech_processors`` ("stt" or "tts")
+            create: Factory returning the processor, or None on failure
+            
+        Returns:
+            The processor, or None if speech is unavailable
+        """
+        if name not in self._speech_processors:
+            with self._speech_lock:
+                if name not in self._speech_processors:
+                    self._speech_processors[name] = create() if self.speech_enabled else None
+        return self._speech_processors[name]
+    
+    def _create_stt_processor(self) -> Optional["STTProcessor"]:
+        """Import and create the speech-to-text processor."""
+        try:
+            from echomind.speech.stt_fasterwhisper import FasterWhisperSTT
+            
+            processor = FasterWhisperSTT(
+                model_size=settings.whisper_model_size,
+                language=settings.stt_language,
+                compute_type=WHISPER_COMPUTE_TYPE,
+                device=WHISPER_DEVICE
+            )
+            logger.info("Speech-to-text initialized")
+            return processor
+        except Exception as e:
+            logger.error(f"Failed to initialize speech-to-text: {e}")
+            self.speech_enabled = False
+            return None
+    
+    def _create_tts_processor(self) -> Optional["TTSProcessor"]:
+        """Import and create the text-to-speech processor."""
+        try:
+            from echomind.speech.tts_pyttsx3 import Pyttsx3TTS
+            
+            processor = Pyttsx3TTS()
+            logger.info("Text-to-speech initialized")
+            return processor
+        except Exception as e:
+            logger.error(f"Failed to initialize text-to-speech: {e}")
+            self.speech_enabled = False
+            return None
+    
     def handle_text(self, user_text: str) -> str:
         """
         Process user text input and generate a response.
@@ -92,24 +189,90 @@ class AssistantOrchestrator:
         Returns:
             Generated response text
         """
+        return "".join(self.handle_text_stream(user_text))
+    
+    def handle_text_stream(self, user_text: str) -> Iterator[str]:
+        """
+        Process user text input and stream the response.
+        
+        Same flow as :meth:`handle_text`, but yields the reply as text deltas
+        while it is generated; the turn is stored in memory once the reply
+        is complete.
+        
+        Args:
+            user_text: User's input text
+        
+        Yields:
+            Successive pieces of the response text
+        """
         if not user_text.strip():
-            return "Please provide some text to process."
+            yield "Please provide some text to process."
+            return
         
         try:
             # Get conversation context
             context = self._get_context()
             
             # Generate response using NLP processor
-            reply = self.nlp.generate(user_text, context=context)
+            parts = []
+            for delta in self.nlp.generate_stream(user_text, context=context):
+                parts.append(delta)
+                yield delta
+            reply = "".join(parts)
             
             # Store the interaction in memory
-            self.memory.add_turn(user_text, reply)
-            self.total_turns += 1
+            self._record_turn(user_text, reply)
             
             logger.debug(f"Processed turn {self.total_turns}: {len(user_text)} chars -> {len(reply)} chars")
             
-            return reply
-            
+        except Exception as e:
+            logger.error(f"Error processing text: {e}")
+            yield f"I encountered an error processing your message: {str(e)}"
+    
+    def handle_text_batch(self, user_texts: List[str]) -> List[str]:
+        """
+        Process several text inputs with a single generation call.
+        
+        All inputs are answered against the same conversation context and
+        then stored in memory in submission order.
+        
+        Args:
+            user_texts: User input texts
+        
+        Returns:
+            One response per input, in the same order
+        """
+        replies = ["Please provide some text to process."] * len(user_texts)
+        pending = [i for i, text in enumerate(user_texts) if text.strip()]
+        if not pending:
+            return replies
+        
+        prompts = [user_texts[i] for i in pending]
+        generated = self.nlp.generate_batch(prompts, context=self._get_context())
+        
+        for i, reply in zip(pending, generated):
+            replies[i] = reply
+            self._record_turn(user_texts[i], reply)
+        
+        logger.debug(f"Processed batch of {len(pending)} turns, now at turn {self.total_turns}")
+        return replies
+    
+    async def handle_text_async(self, user_text: str) -> str:
+        """
+        Process user text input through the dynamic text batcher.
+        
+        Requests from concurrent users are grouped and answered by one
+        :meth:`handle_text_batch` call. Use :meth:`handle_text_stream` when the
+        caller shows the reply while it is generated.
+        
+        Args:
+            user_text: User's input text
+        
+        Returns:
+            Generated response text
+        """
+        try:
+            return await self.text_batcher.submit(user_text)
         except Exception as e:
             logger.error(f"Error processing text: {e}")
             return f"I encountered an error processing your message: {str(e)}"
@@ -130,19 +293,136 @@ class AssistantOrchestrator:
         try:
             # Transcribe audio to text
             transcribed_text = self.stt_processor.transcribe(audio_data)
+            return self._respond_to_transcript(transcribed_text)
             
+        except Exception as e:
+            logger.error(f"Voice processing failed: {e}")
+            return f"Sorry, I had trouble processing your voice input: {str(e)}"
+    
+    async def handle_voice_input_async(
+        self,
+        audio_data: "Union[bytes, np.ndarray]",
+        sample_rate: Optional[int] = None
+    ) -> str:
+        """
+        Process voice input through the dynamic STT batcher.
+        
+        Concurrent calls are transcribed together in one batch, which keeps the
+        Whisper model busy at batch size > 1 under load.
+        
+        Args:
+            audio_data: Raw audio data, or audio samples when ``sample_rate`` is given
+            sample_rate: Sample rate of ``audio_data`` if it is a sample array
+        
+        Returns:
+            Generated response text
+        """
+        if not self.speech_enabled or not self.stt_batcher:
+            return "Speech processing is not available. Please use text input."
+        
+        try:
+            if sample_rate is not None:
+                audio_data = await asyncio.to_thread(self._prepare_samples, sample_rate, audio_data)
+            transcribed_text = await self.stt_batcher.submit(audio_data)
             if not transcribed_text.strip():
                 return "I couldn't hear anything. Please try speaking again."
             
             logger.info(f"Transcribed: '{transcribed_text}'")
             
-            # Process the transcribed text
-            return self.handle_text(transcribed_text)
+            # Answer off the event loop, batched with concurrent text requests
+            return await self.text_batcher.submit(transcribed_text)
             
         except Exception as e:
             logger.error(f"Voice processing failed: {e}")
             return f"Sorry, I had trouble processing your voice input: {str(e)}"
     
+    async def stream_voice(
+        self,
+        audio_stream: AsyncIterable[bytes],
+        synthesize: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process a stream of utterances with overlapping STT, NLP and TTS stages.
+        
+        Args:
+            audio_stream: Async iterable of audio clips, one per utterance
+            synthesize: Whether to synthesize speech for each reply
+        
+        Yields:
+            Dictionaries with ``transcript``, ``reply``, ``audio`` and ``error`` keys, in input order
+        """
+        if not self.speech_enabled or not self.stt_processor:
+            raise RuntimeError("Speech processing is not available")
+        
+        pipeline = VoicePipeline(
+            transcribe=self.stt_processor.transcribe,
+            respond=self._respond_to_transcript,
+            synthesize=self.synthesize_response if synthesize else None
+        )
+        await pipeline.start()
+        
+        async def feed() -> None:
+            try:
+                async for audio_data in audio_stream:
+                    await pipeline.submit(audio_data)
+            except BaseException:
+                # Unblock the consumer; the error is re-raised by awaiting the feeder
+                await pipeline.close()
+                raise
+            await pipeline.finish()
+        
+        feeder = asyncio.create_task(feed())
+        try:
+            async for result in pipeline.results():
+                yield result
+            await feeder
+        finally:
+            # The consumer may stop early; don't leave the feeder or stages running
+            feeder.cancel()
+            await asyncio.gather(feeder, return_exceptions=True)
+            await pipeline.close()
+    
+    @staticmethod
+    def _prepare_samples(sample_rate: int, samples: "np.ndarray") -> "np.ndarray":
+        """
+        Convert raw samples to the 16 kHz mono float32 audio the STT engine expects.
+        
+        Args:
+            sample_rate: Sample rate of ``samples`` in Hz
+            samples: Audio samples, shaped (n,) or (n, channels)
+        
+        Returns:
+            Mono float32 samples at 16 kHz
+        """
+        from echomind.speech.audio_utils import AudioUtils
+        
+        audio = AudioUtils.to_mono_float32(samples)
+        return AudioUtils.resample_audio(audio, sample_rate, STT_SAMPLE_RATE)
+    
+    def _transcribe_batch(self, clips: List[bytes]) -> List[str]:
+        """Batch function for the STT batcher; resolves the processor lazily."""
+        if not self.stt_processor:
+            raise RuntimeError("Speech-to-text is not available")
+        return self.stt_processor.transcribe_batch(clips)
+    
+    def _respond_to_transcript(self, transcribed_text: str) -> str:
+        """
+        Turn a transcription into a reply.
+        
+        Args:
+            transcribed_text: Text produced by speech-to-text
+        
+        Returns:
+            Generated response text
+        """
+        if not transcribed_text.strip():
+            return "I couldn't hear anything. Please try speaking again."
+        
+        logger.info(f"Transcribed: '{transcribed_text}'")
+        
+        # Process the transcribed text
+        return self.handle_text(transcribed_text)
+    
     def synthesize_response(self, text: str) -> bytes:
         """
         Convert text response to speech using text-to-speech.
@@ -165,24 +445,81 @@ class AssistantOrchestrator:
             logger.error(f"Speech synthesis failed: {e}")
             return b""
     
+    def synthesize_stream(self, text: str) -> Iterator[Tuple[int, "np.ndarray"]]:
+        """
+        Convert text response to speech as playable sample chunks.
+        
+        Each sentence is synthesized and decoded as soon as it is ready, so a
+        streaming audio player can start before the whole reply is rendered.
+        
+        Args:
+            text: Text to convert to speech
+        
+        Yields:
+            Tuples of (sample_rate, samples), one per sentence
+        """
+        if not self.speech_enabled or not self.tts_processor:
+            return
+        
+        from echomind.speech.audio_utils import AudioUtils
+        
+        try:
+            for audio_data in self.tts_processor.synthesize_stream(text):
+                # Decode at the engine's own rate; no resampling needed for playback
+                sample_rate = AudioUtils.get_audio_info(audio_data)["sample_rate"]
+                samples = AudioUtils.bytes_to_numpy(audio_data, sample_rate)
+                if samples.size:
+                    yield sample_rate, samples
+        except Exception as e:
+            logger.error(f"Streaming speech synthesis failed: {e}")
+    
+    def warmup(self) -> None:
+        """
+        Load the speech models and run each once on dummy input.
+        
+        Moves the model load and first-inference cost from the first voice
+        request to startup. Nothing is stored in conversation memory.
+        """
+        if not self.speech_enabled:
+            return
+        
+        try:
+            import numpy as np
+            
+            if self.stt_processor:
+                self.stt_processor.transcribe(np.zeros(STT_SAMPLE_RATE, dtype=np.float32))
+            if self.tts_processor:
+                self.tts_processor.synthesize("warmup")
+            logger.info("Speech models warmed up")
+        except Exception as e:
+            logger.warning(f"Speech warmup failed: {e}")
+    
     def get_speech_info(self) -> Dict[str, Any]:
         """
         Get information about speech processing capabilities.
         
+        Processors that have not been created yet are reported from the
+        dependency check alone, so asking for status never loads speech code.
+        Engine details are only included once a processor is initialized.
+        
         Returns:
             Dictionary containing speech processing information
         """
+        # Only report processors that already exist; don't create them here
+        stt = self._speech_processors.get("stt")
+        tts = self._speech_processors.get("tts")
+        
         info = {
             "speech_enabled": self.speech_enabled,
-            "stt_available": self.stt_processor is not None,
-            "tts_available": self.tts_processor is not None,
+            "stt_available": stt is not None if "stt" in self._speech_processors else self.speech_enabled,
+            "tts_available": tts is not None if "tts" in self._speech_processors else self.speech_enabled,
         }
         
-        if self.stt_processor:
-            info["stt_info"] = self.stt_processor.get_model_info()
+        if stt is not None and stt.is_initialized:
+            info["stt_info"] = stt.get_model_info()
         
-        if self.tts_processor:
-            info["tts_info"] = self.tts_processor.get_engine_info()
+        if tts is not None and tts.is_initialized:
+            info["tts_info"] = tts.get_engine_info()
         
         return info
     
@@ -221,9 +558,11 @@ class AssistantOrchestrator:
         Returns:
             Confirmation message
         """
-        self.memory.clear()
-        self.conversation_start = datetime.now()
-        self.total_turns = 0
+        with self._turn_lock:
+            self.memory.clear()
+            self._recent_turns.clear()
+            self.conversation_start = datetime.now()
+            self.total_turns = 0
         
         logger.info("Conversation cleared and reset")
         return "Conversation history cleared. Starting fresh!"
@@ -257,7 +596,11 @@ class AssistantOrchestrator:
             Success/error message
         """
         try:
-            self.memory.load_from_file(filepath)
+            with self._turn_lock:
+                self.memory.load_from_file(filepath)
+                self._recent_turns.clear()
+                for user_text, assistant_text in self.memory.as_list()[-CONTEXT_TURNS:]:
+                    self._remember_recent_turn(user_text, assistant_text)
             logger.info(f"Conversation imported from {filepath}")
             return f"Conversation imported successfully from {filepath}"
         except Exception as e:
@@ -271,11 +614,34 @@ class AssistantOrchestrator:
         Returns:
             Formatted context string or None if no context available
         """
-        if self.memory.is_empty():
+        # Snapshot under the lock; another request thread may be appending
+        with self._turn_lock:
+            turns = list(self._recent_turns)
+        if not turns:
             return None
         
-        # Get the last few turns for context
-        return self.memory.get_recent_context(turns=3)
+        # Number the pre-formatted recent turns; same layout as memory.get_context()
+        return "\n".join(
+            f"Turn {i}:\n{turn}" for i, turn in enumerate(turns, 1)
+        ).strip()
+    
+    def _record_turn(self, user_text: str, assistant_text: str) -> None:
+        """Store a finished turn in memory, the recent-context buffer and the turn count."""
+        with self._turn_lock:
+            self.memory.add_turn(user_text, assistant_text)
+            self._remember_recent_turn(user_text, assistant_text)
+            self.total_turns += 1
+    
+    def _remember_recent_turn(self, user_text: str, assistant_text: str) -> None:
+        """
+        Append a turn to the recent-context ring buffer.
+        
+        Mirrors ConversationMemory.add_turn, which strips text and skips empty turns.
+        """
+        user_text = user_text.strip()
+        assistant_text = assistant_text.strip()
+        if user_text and assistant_text:
+            self._recent_turns.append(f"User: {user_text}\nAssistant: {assistant_text}\n")
     
     def get_system_status(self) -> Dict[str, Any]:
         """
@@ -292,6 +658,8 @@ class AssistantOrchestrator:
             "system_info": {
                 "config": {
                     "whisper_model_size": settings.whisper_model_size,
+                    "whisper_compute_type": WHISPER_COMPUTE_TYPE,
+                    "whisper_device": WHISPER_DEVICE,
                     "stt_language": settings.stt_language,
                     "max_conversation_turns": settings.max_conversation_turns,
                     "theme": settings.theme,
@@ -0,0 +1,173 @@
+"""
+Voice Pipeline
+=============
+
+This module provides an asynchronous three-stage voice pipeline for the EchoMind-NLP assistant.
+Speech-to-text, response generation and text-to-speech run as separate asyncio tasks
+connected by queues, so consecutive utterances overlap: while utterance N is being
+answered, utterance N+1 is already being transcribed and N-1 synthesized.
+
+Features:
+- One worker task per stage, blocking model calls run in threads
+- Bounded queues for backpressure
+- Results delivered in submission order through ``async for``
+- Per-utterance errors reported in the result instead of stalling the stream
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+from loguru import logger
+
+
+# Marks the end of the input stream as it flows through the stages
+_STOP = object()
+
+
+class VoicePipeline:
+    """
+    Overlapping STT → NLP → TTS pipeline.
+    
+    Each stage takes the output of the previous one from a queue, so the
+    overall throughput is bounded by the slowest stage instead of the sum
+    of all three. An utterance that fails in one stage skips the remaining
+    stages and is delivered with its ``error`` set.
+    
+    Attributes:
+        transcribe: Blocking function converting audio to text
+        respond: Blocking function converting a transcript to a reply
+        synthesize: Optional blocking function converting a reply to audio bytes
+        max_pending: Maximum items waiting between two stages
+    """
+    
+    def __init__(
+        self,
+        transcribe: Callable[[Any], str],
+        respond: Callable[[str], str],
+        synthesize: Optional[Callable[[str], bytes]] = None,
+        max_pending: int = 8,
+    ) -> None:
+        """
+        Initialize the pipeline.
+        
+        Args:
+            transcribe: Speech-to-text function
+            respond: Reply generation function
+            synthesize: Text-to-speech function, or None to skip audio output
+            max_pending: Queue size between stages
+        """
+        self.transcribe = transcribe
+        self.respond = respond
+        self.synthesize = synthesize
+        self.max_pending = max_pending
+        self._stt_q: Optional[asyncio.Queue] = None
+        self._out_q: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+    
+    async def start(self) -> None:
+        """Create the queues and launch one worker task per stage."""
+        self._stt_q = asyncio.Queue(self.max_pending)
+        nlp_q: asyncio.Queue = asyncio.Queue(self.max_pending)
+        tts_q: asyncio.Queue = asyncio.Queue(self.max_pending)
+        self._out_q = asyncio.Queue()
+        self._tasks = [
+            asyncio.create_task(self._run_stage(self._transcribe_item, self._stt_q, nlp_q)),
+            asyncio.create_task(self._run_stage(self._respond_item, nlp_q, tts_q)),
+            asyncio.create_task(self._run_stage(self._synthesize_item, tts_q, self._out_q)),
+        ]
+        for task in self._tasks:
+            task.add_done_callback(self._on_stage_done)
+    
+    async def submit(self, audio_data: Any) -> None:
+        """
+        Queue an utterance for processing.
+        
+        Args:
+            audio_data: Audio in any format accepted by ``transcribe``
+        """
+        await self._stt_q.put({
+            "transcript": "",
+            "reply": "",
+            "audio": b"",
+            "error": None,
+            "_input": audio_data,
+        })
+    
+    async def finish(self) -> None:
+        """Signal that no more audio will be submitted; results end after the last utterance."""
+        await self._stt_q.put(_STOP)
+    
+    async def close(self) -> None:
+        """Cancel the stage tasks and wait for them to exit."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+    
+    async def results(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield one result per submitted utterance until the pipeline finishes.
+        
+        Yields:
+            Dictionaries with ``transcript``, ``reply``, ``audio`` and ``error`` keys;
+            ``error`` holds the exception of a failed utterance, otherwise None
+        
+        Raises:
+            Exception: If a stage task itself crashed
+        """
+        while True:
+            result = await self._out_q.get()
+            if result is _STOP:
+                break
+            yield result
+        
+        for task in self._tasks:
+            if task.done() and not task.cancelled() and task.exception() is not None:
+                raise task.exception()
+    
+    async def _run_stage(
+        self,
+        step: Callable[[Dict[str, Any]], None],
+        inbox: asyncio.Queue,
+        outbox: asyncio.Queue
+    ) -> None:
+        """
+        Apply one stage to every item from ``inbox`` and pass it on to ``outbox``.
+        
+        Args:
+            step: Blocking function updating an item in place
+            inbox: Queue fed by the previous stage
+            outbox: Queue read by the next stage (or the consumer)
+        """
+        while True:
+            item = await inbox.get()
+            if item is _STOP:
+                await outbox.put(_STOP)
+                return
+            if item["error"] is None:
+                try:
+                    await asyncio.to_thread(step, item)
+                except Exception as e:
+                    logger.error(f"Voice pipeline {step.__name__} failed: {e}")
+                    item["error"] = e
+            item.pop("_input", None)
+            await outbox.put(item)
+    
+    def _on_stage_done(self, task: asyncio.Task) -> None:
+        """Tear the pipeline down when a stage crashed or was cancelled, releasing the consumer."""
+        if not task.cancelled() and task.exception() is None:
+            return
+        for other in self._tasks:
+            other.cancel()
+        self._out_q.put_nowait(_STOP)
+    
+    def _transcribe_item(self, item: Dict[str, Any]) -> None:
+        """Speech-to-text stage."""
+        item["transcript"] = self.transcribe(item["_input"])
+    
+    def _respond_item(self, item: Dict[str, Any]) -> None:
+        """Reply generation stage."""
+        item["reply"] = self.respond(item["transcript"])
+    
+    def _synthesize_item(self, item: Dict[str, Any]) -> None:
+        """Text-to-speech stage."""
+        if self.synthesize is not None:
+            item["audio"] = self.synthesize(item["reply"])
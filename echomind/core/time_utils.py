@@ -0,0 +1,46 @@
+"""
+Time Utilities
+=============
+
+This module provides cheap "current time" strings for hot paths such as text
+analysis, status commands and memory serialization.
+
+Formatting a datetime on every call costs a clock read, an allocation and a
+format parse; these helpers format at most once per wall-clock second and
+otherwise return the cached string.
+"""
+
+import time
+from datetime import datetime
+
+# [epoch second, formatted string] for each cached format
+_now_cache = [0, ""]
+_iso_cache = [0, ""]
+
+
+def now_str() -> str:
+    """
+    Get the current local time as ``YYYY-MM-DD HH:MM:SS``.
+
+    Returns:
+        Formatted time, exact to the second
+    """
+    second = int(time.time())
+    if second != _now_cache[0]:
+        _now_cache[1] = datetime.fromtimestamp(second).strftime('%Y-%m-%d %H:%M:%S')
+        _now_cache[0] = second
+    return _now_cache[1]
+
+
+def iso_now() -> str:
+    """
+    Get the current local time in ISO 8601 format with second precision.
+
+    Returns:
+        ISO formatted time, e.g. ``2024-01-31T12:00:00``
+    """
+    second = int(time.time())
+    if second != _iso_cache[0]:
+        _iso_cache[1] = datetime.fromtimestamp(second).isoformat()
+        _iso_cache[0] = second
+    return _iso_cache[1]
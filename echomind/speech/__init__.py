@@ -11,13 +11,30 @@ Modules:
 - tts_pyttsx3: pyttsx3 implementation
 - tts_elevenlabs: ElevenLabs implementation
 - audio_utils: Audio processing utilities
+
+Public names are imported from their submodule on first access, so importing
+one module (e.g. tts_pyttsx3 in the TTS worker process) does not load the
+others and their native dependencies.
 """
 
-from .stt_base import STTProcessor
-from .stt_fasterwhisper import FasterWhisperSTT
-from .tts_base import TTSProcessor
-from .tts_pyttsx3 import Pyttsx3TTS
-from .audio_utils import AudioUtils
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .stt_base import STTProcessor
+    from .stt_fasterwhisper import FasterWhisperSTT
+    from .tts_base import TTSProcessor
+    from .tts_pyttsx3 import Pyttsx3TTS
+    from .audio_utils import AudioUtils
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    "STTProcessor": "stt_base",
+    "FasterWhisperSTT": "stt_fasterwhisper",
+    "TTSProcessor": "tts_base",
+    "Pyttsx3TTS": "tts_pyttsx3",
+    "AudioUtils": "audio_utils",
+}
 
 __all__ = [
     "STTProcessor",
@@ -26,3 +43,19 @@ __all__ = [
     "Pyttsx3TTS",
     "AudioUtils",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list:
+    """Include the lazily imported names."""
+    return sorted(set(globals()) | set(__all__))
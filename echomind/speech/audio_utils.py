@@ -6,10 +6,13 @@ This module provides utility functions for audio processing,
 format conversion, and audio data manipulation.
 """
 
+import importlib.util
 import io
-import tempfile
-import wave
-from typing import Union, Tuple, Optional
+import struct
+import threading
+from functools import lru_cache
+from math import gcd
+from typing import List, NamedTuple, Optional, Union
 import numpy as np
 from loguru import logger
 
@@ -21,11 +24,176 @@ except ImportError:
     logger.warning("soundfile not available. Install with: pip install soundfile")
 
 try:
-    from pydub import AudioSegment
-    PYDUB_AVAILABLE = True
+    import soxr
+    SOXR_AVAILABLE = True
 except ImportError:
-    PYDUB_AVAILABLE = False
-    logger.warning("pydub not available. Install with: pip install pydub")
+    SOXR_AVAILABLE = False
+
+# scipy is only the fallback resampler; probe it now and import it on first use
+SCIPY_AVAILABLE = importlib.util.find_spec("scipy") is not None
+
+if not (SOXR_AVAILABLE or SCIPY_AVAILABLE):
+    logger.warning("Neither soxr nor scipy available; resampling falls back to linear interpolation. Install with: pip install soxr")
+
+# numba is optional and only used by trim_silence(..., use_numba=True)
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+def _trim_bounds(audio_data: np.ndarray, threshold: float):
+    """
+    Find the first and one-past-last loud sample of 1-D audio.
+    
+    Scans inward from both ends and stops at the first loud sample, so
+    only the silent edges are read rather than the whole buffer.
+    Returns (0, 0) if no sample reaches the threshold.
+    """
+    n = audio_data.size
+    start = 0
+    while start < n and not abs(audio_data[start]) >= threshold:
+        start += 1
+    if start == n:
+        return 0, 0
+    
+    end = n
+    while not abs(audio_data[end - 1]) >= threshold:
+        end -= 1
+    return start, end
+
+
+@lru_cache(maxsize=None)
+def _compiled_trim_bounds():
+    """Import numba and compile _trim_bounds on first use."""
+    from numba import njit
+    
+    return njit(cache=True, nogil=True)(_trim_bounds)
+
+
+# Per-thread soxr streams; a stream holds filter state and is not thread-safe
+_resampler_local = threading.local()
+
+
+def _get_resample_stream(original_rate: int, target_rate: int, channels: int, dtype: np.dtype):
+    """
+    Get a cached soxr stream for a rate pair, so its filter is designed only once.
+    
+    Args:
+        original_rate: Original sample rate
+        target_rate: Target sample rate
+        channels: Number of interleaved channels
+        dtype: Sample dtype (float32, float64, int16 or int32)
+        
+    Returns:
+        A cleared soxr.ResampleStream ready for a new signal
+    """
+    streams = getattr(_resampler_local, "streams", None)
+    if streams is None:
+        streams = _resampler_local.streams = {}
+    
+    key = (original_rate, target_rate, channels, dtype.name)
+    stream = streams.get(key)
+    if stream is None:
+        stream = streams[key] = soxr.ResampleStream(
+            original_rate, target_rate, channels, dtype=dtype.name, quality="HQ"
+        )
+    else:
+        stream.clear()  # Drop the previous signal's tail
+    return stream
+
+
+# Container magic bytes as (format name, ((offset, signature), ...)); all must match
+AUDIO_SIGNATURES = (
+    ("WAV", ((0, b'RIFF'), (8, b'WAVE'))),
+    ("OGG", ((0, b'OggS'),)),
+    ("FLAC", ((0, b'fLaC'),)),
+    ("MP3", ((0, b'ID3'),)),
+    ("MP3", ((0, b'\xff\xfb'),)),
+    ("MP3", ((0, b'\xff\xf3'),)),
+    ("MP3", ((0, b'\xff\xf2'),)),
+    ("AAC", ((0, b'\xff\xf1'),)),
+    ("AAC", ((0, b'\xff\xf9'),)),
+    ("MP4", ((4, b'ftyp'),)),
+    ("WEBM", ((0, b'\x1a\x45\xdf\xa3'),)),
+    ("AIFF", ((0, b'FORM'), (8, b'AIFF'))),
+    ("AIFF", ((0, b'FORM'), (8, b'AIFC'))),
+    ("AU", ((0, b'.snd'),)),
+    ("CAF", ((0, b'caff'),)),
+)
+
+# Formats libsndfile can decode; others are left to an ffmpeg-based decoder
+SOUNDFILE_FORMATS = frozenset({"WAV", "OGG", "FLAC", "MP3", "AIFF", "AU", "CAF"})
+
+# WAVE format tag for uncompressed integer PCM
+WAVE_FORMAT_PCM = 1
+
+
+class _WavHeader(NamedTuple):
+    """Fields of a RIFF/WAVE header needed to locate and interpret the samples."""
+    format_tag: int
+    channels: int
+    sample_rate: int
+    block_align: int
+    bits_per_sample: int
+    data_offset: int
+    data_size: int
+
+
+def _parse_wav_header(audio_bytes: bytes) -> Optional[_WavHeader]:
+    """
+    Parse a WAV header with struct instead of the wave module.
+    
+    Walks the RIFF chunk list from offset 12, so files with extra chunks
+    (LIST, fact, ...) before 'fmt ' or 'data' are handled. The data size is
+    clamped to the bytes actually present, since streamed WAVs often carry
+    a placeholder length.
+    
+    Args:
+        audio_bytes: Audio data as bytes
+        
+    Returns:
+        Parsed header, or None if this is not a WAV buffer with 'fmt ' and 'data' chunks
+    """
+    if len(audio_bytes) < 12 or audio_bytes[:4] != b'RIFF' or audio_bytes[8:12] != b'WAVE':
+        return None
+    
+    fmt = None
+    end = len(audio_bytes)
+    offset = 12
+    while offset + 8 <= end:
+        chunk_id = audio_bytes[offset:offset + 4]
+        chunk_size, = struct.unpack_from('<I', audio_bytes, offset + 4)
+        body = offset + 8
+        
+        if chunk_id == b'fmt ' and chunk_size >= 16 and body + 16 <= end:
+            format_tag, channels, sample_rate, _, block_align, bits = struct.unpack_from('<HHIIHH', audio_bytes, body)
+            fmt = (format_tag, channels, sample_rate, block_align, bits)
+        elif chunk_id == b'data':
+            if fmt is None:
+                return None
+            return _WavHeader(*fmt, body, min(chunk_size, end - body))
+        
+        offset = body + chunk_size + (chunk_size & 1)  # Chunks are word-aligned
+    
+    return None
+
+
+def _float_to_pcm16(audio_array: np.ndarray) -> np.ndarray:
+    """
+    Convert float samples in [-1, 1] to int16 PCM.
+    
+    Works in a single float32 scratch buffer: out-of-range samples are
+    clipped instead of wrapping around, and values are rounded rather
+    than truncated.
+    
+    Args:
+        audio_array: Audio samples as a float numpy array
+        
+    Returns:
+        Audio samples as int16
+    """
+    scratch = np.clip(audio_array, -1.0, 1.0, out=np.empty(audio_array.shape, dtype=np.float32))
+    np.multiply(scratch, np.float32(32767.0), out=scratch)
+    np.rint(scratch, out=scratch)
+    return scratch.astype(np.int16)
 
 
 class AudioUtils:
@@ -49,21 +217,35 @@ class AudioUtils:
             Audio data as numpy array
         """
         try:
+            # Fast path: 16-bit PCM WAV is viewed in place and scaled in one pass
+            header = _parse_wav_header(audio_bytes)
+            if header and header.format_tag == WAVE_FORMAT_PCM and header.bits_per_sample == 16 and header.channels > 0:
+                frames = header.data_size // (2 * header.channels)
+                pcm = np.frombuffer(audio_bytes, dtype='<i2', count=frames * header.channels, offset=header.data_offset)
+                data = np.empty(pcm.shape, dtype=np.float32)
+                np.multiply(pcm, np.float32(1.0 / 32768.0), out=data)
+                if header.channels > 1:
+                    data = data.reshape(-1, header.channels)  # Same (frames, channels) layout as soundfile
+                if header.sample_rate != sample_rate:
+                    data = AudioUtils.resample_audio(data, header.sample_rate, sample_rate)
+                return data
+            
+            audio_format = AudioUtils.validate_audio_format(audio_bytes)
+            if audio_format not in SOUNDFILE_FORMATS:
+                # Don't pay for a decode attempt that cannot succeed
+                logger.debug(f"Cannot decode {audio_format or 'unrecognized'} audio with soundfile")
+                return np.array([])
+            
             if SOUNDFILE_AVAILABLE:
-                # Use soundfile for better format support
+                # Use soundfile for other formats and sample widths
                 with io.BytesIO(audio_bytes) as audio_io:
-                    data, sr = sf.read(audio_io)
+                    data, sr = sf.read(audio_io, dtype='float32', always_2d=False)
                     if sr != sample_rate:
                         data = AudioUtils.resample_audio(data, sr, sample_rate)
                     return data
-            else:
-                # Fallback to wave module for WAV files
-                with io.BytesIO(audio_bytes) as audio_io:
-                    with wave.open(audio_io, 'rb') as wav_file:
-                        frames = wav_file.readframes(wav_file.getnframes())
-                        data = np.frombuffer(frames, dtype=np.int16)
-                        data = data.astype(np.float32) / 32768.0
-                        return data
+            
+            logger.warning("Only 16-bit PCM WAV can be decoded without soundfile")
+            return np.array([])
                         
         except Exception as e:
             logger.error(f"Failed to convert audio bytes to numpy: {e}")
@@ -88,23 +270,49 @@ class AudioUtils:
                     sf.write(audio_io, audio_array, sample_rate, format='WAV')
                     return audio_io.getvalue()
             else:
-                # Fallback to wave module
-                with io.BytesIO() as audio_io:
-                    with wave.open(audio_io, 'wb') as wav_file:
-                        wav_file.setnchannels(1)  # Mono
-                        wav_file.setsampwidth(2)  # 16-bit
-                        wav_file.setframerate(sample_rate)
-                        
-                        # Convert to int16
-                        audio_int16 = (audio_array * 32767).astype(np.int16)
-                        wav_file.writeframes(audio_int16.tobytes())
-                    
-                    return audio_io.getvalue()
+                # Fallback: 16-bit PCM with a hand-packed 44-byte header
+                channels = audio_array.shape[1] if audio_array.ndim == 2 else 1
+                pcm = _float_to_pcm16(audio_array).tobytes()
+                block_align = 2 * channels
+                header = struct.pack(
+                    '<4sI4s4sIHHIIHH4sI',
+                    b'RIFF', 36 + len(pcm), b'WAVE',
+                    b'fmt ', 16, WAVE_FORMAT_PCM, channels, sample_rate,
+                    sample_rate * block_align, block_align, 16,
+                    b'data', len(pcm)
+                )
+                return header + pcm
                     
         except Exception as e:
             logger.error(f"Failed to convert numpy to audio bytes: {e}")
             return b""
     
+    @staticmethod
+    def to_mono_float32(audio_data: np.ndarray) -> np.ndarray:
+        """
+        Convert audio samples to mono float32 in [-1, 1].
+        
+        Args:
+            audio_data: Audio samples, shaped (n,) or (n, channels); integer
+                PCM is scaled by its full range, unsigned PCM around its midpoint
+            
+        Returns:
+            Mono float32 samples
+        """
+        if np.issubdtype(audio_data.dtype, np.unsignedinteger):
+            # Unsigned PCM is centred on its midpoint, e.g. (x - 128) / 128 for uint8
+            midpoint = np.float32(np.iinfo(audio_data.dtype).max // 2 + 1)
+            audio = np.subtract(audio_data, midpoint, dtype=np.float32)
+            audio /= midpoint
+        elif np.issubdtype(audio_data.dtype, np.integer):
+            # PCM integers: scale to [-1, 1] like a decoded WAV would be
+            audio = np.multiply(audio_data, np.float32(1.0 / -np.iinfo(audio_data.dtype).min), dtype=np.float32)
+        else:
+            audio = audio_data.astype(np.float32, copy=False)
+        if audio.ndim == 2:
+            audio = audio.mean(axis=1, dtype=np.float32)
+        return audio
+    
     @staticmethod
     def resample_audio(audio_data: np.ndarray, original_rate: int, target_rate: int) -> np.ndarray:
         """
@@ -122,33 +330,22 @@ class AudioUtils:
             return audio_data
         
         try:
-            if PYDUB_AVAILABLE:
-                # Use pydub for resampling
-                # Convert numpy to audio segment
-                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                    sf.write(temp_file.name, audio_data, original_rate)
-                    temp_file_path = temp_file.name
+            if SOXR_AVAILABLE:
+                # Band-limited SIMD sinc resampler; supports these dtypes natively
+                if audio_data.dtype not in (np.float32, np.float64, np.int16, np.int32):
+                    audio_data = audio_data.astype(np.float32)
+                channels = audio_data.shape[1] if audio_data.ndim == 2 else 1
+                stream = _get_resample_stream(original_rate, target_rate, channels, audio_data.dtype)
+                return stream.resample_chunk(audio_data, last=True)
+            elif SCIPY_AVAILABLE:
+                # Polyphase FIR resampling in memory, using the reduced rate ratio
+                from scipy.signal import resample_poly
                 
-                try:
-                    # Load with pydub and resample
-                    audio_segment = AudioSegment.from_wav(temp_file_path)
-                    resampled = audio_segment.set_frame_rate(target_rate)
-                    
-                    # Convert back to numpy
-                    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file2:
-                        resampled.export(temp_file2.name, format="wav")
-                        temp_file2_path = temp_file2.name
-                    
-                    try:
-                        data, _ = sf.read(temp_file2_path)
-                        return data
-                    finally:
-                        import os
-                        os.unlink(temp_file2_path)
-                        
-                finally:
-                    import os
-                    os.unlink(temp_file_path)
+                g = gcd(original_rate, target_rate)
+                resampled = resample_poly(audio_data, target_rate // g, original_rate // g)
+                if np.issubdtype(audio_data.dtype, np.floating):
+                    resampled = resampled.astype(audio_data.dtype, copy=False)
+                return resampled
             else:
                 # Simple resampling (not as accurate)
                 ratio = target_rate / original_rate
@@ -161,12 +358,13 @@ class AudioUtils:
             return audio_data
     
     @staticmethod
-    def normalize_audio(audio_data: np.ndarray) -> np.ndarray:
+    def normalize_audio(audio_data: np.ndarray, in_place: bool = False) -> np.ndarray:
         """
         Normalize audio to prevent clipping.
         
         Args:
             audio_data: Audio data as numpy array
+            in_place: Scale a floating-point buffer in place instead of allocating a new one
             
         Returns:
             Normalized audio data
@@ -174,19 +372,24 @@ class AudioUtils:
         if len(audio_data) == 0:
             return audio_data
         
-        max_val = np.max(np.abs(audio_data))
+        # Peak from two reductions, without a full-size abs() temporary
+        max_val = max(-float(audio_data.min()), float(audio_data.max()))
         if max_val > 0:
-            return audio_data / max_val * 0.95  # Leave some headroom
+            scale = 0.95 / max_val  # Leave some headroom
+            out = audio_data if in_place and np.issubdtype(audio_data.dtype, np.floating) else None
+            return np.multiply(audio_data, scale, out=out)
         return audio_data
     
     @staticmethod
-    def trim_silence(audio_data: np.ndarray, threshold: float = 0.01) -> np.ndarray:
+    def trim_silence(audio_data: np.ndarray, threshold: float = 0.01, use_numba: bool = False) -> np.ndarray:
         """
         Remove silence from the beginning and end of audio.
         
         Args:
             audio_data: Audio data as numpy array
             threshold: Silence threshold
+            use_numba: Use a compiled early-exit scan for 1-D float audio if
+                numba is installed; compiled on first use
             
         Returns:
             Audio data with silence trimmed
@@ -194,26 +397,45 @@ class AudioUtils:
         if len(audio_data) == 0:
             return audio_data
         
-        # Find non-silent regions
-        energy = np.abs(audio_data)
-        silent = energy < threshold
+        if use_numba and NUMBA_AVAILABLE and audio_data.ndim == 1 and audio_data.dtype.kind == 'f':
+            # Compiled early-exit scan from both ends; compare in the sample dtype like NumPy does
+            start, end = _compiled_trim_bounds()(audio_data, audio_data.dtype.type(threshold))
+            if start == end:
+                return audio_data  # All silent: nothing to trim against
+            return audio_data[start:end]
         
-        # Find start and end
-        start = 0
-        end = len(audio_data)
+        # Find non-silent samples in one vectorized pass
+        loud = np.abs(audio_data) >= threshold
+        if loud.ndim > 1:
+            loud = loud.any(axis=tuple(range(1, loud.ndim)))
         
-        for i in range(len(silent)):
-            if not silent[i]:
-                start = i
-                break
+        if not loud.any():
+            return audio_data  # All silent: nothing to trim against
         
-        for i in range(len(silent) - 1, -1, -1):
-            if not silent[i]:
-                end = i + 1
-                break
+        start = int(np.argmax(loud))
+        end = len(loud) - int(np.argmax(loud[::-1]))
         
         return audio_data[start:end]
     
+    @staticmethod
+    def is_silent(audio_data: np.ndarray, threshold: float = 0.01) -> bool:
+        """
+        Check whether audio is silent using its RMS energy.
+        
+        Args:
+            audio_data: Float audio data as numpy array
+            threshold: RMS level below which audio counts as silence
+            
+        Returns:
+            True if the audio is empty or its RMS is below the threshold
+        """
+        flat = audio_data.ravel()
+        if flat.size == 0:
+            return True
+        
+        # Mean square via a dot product, without a squared temporary
+        return float(np.dot(flat, flat)) / flat.size < threshold * threshold
+    
     @staticmethod
     def get_audio_info(audio_data: Union[bytes, np.ndarray]) -> dict:
         """
@@ -239,19 +461,16 @@ class AudioUtils:
             if isinstance(audio_data, bytes):
                 info["length_bytes"] = len(audio_data)
                 
-                # Try to get info from WAV header
-                if len(audio_data) >= 44:  # Minimum WAV header size
-                    with io.BytesIO(audio_data) as audio_io:
-                        try:
-                            with wave.open(audio_io, 'rb') as wav_file:
-                                info["sample_rate"] = wav_file.getframerate()
-                                info["channels"] = wav_file.getnchannels()
-                                info["length_samples"] = wav_file.getnframes()
-                                info["duration_seconds"] = wav_file.getnframes() / wav_file.getframerate()
-                                info["format"] = "WAV"
-                        except:
-                            pass
-                            
+                # Read the WAV header fields directly
+                header = _parse_wav_header(audio_data)
+                if header and header.sample_rate > 0 and header.block_align > 0:
+                    nframes = header.data_size // header.block_align
+                    info["sample_rate"] = header.sample_rate
+                    info["channels"] = header.channels
+                    info["length_samples"] = nframes
+                    info["duration_seconds"] = nframes / header.sample_rate
+                    info["format"] = "WAV"
+                
             elif isinstance(audio_data, np.ndarray):
                 info["length_samples"] = len(audio_data)
                 info["duration_seconds"] = len(audio_data) / info["sample_rate"]
@@ -263,24 +482,142 @@ class AudioUtils:
         return info
     
     @staticmethod
-    def validate_audio_format(audio_data: bytes) -> bool:
+    def validate_audio_format(audio_data: bytes) -> Optional[str]:
         """
-        Validate if audio data is in a supported format.
+        Detect the container format of audio data from its magic bytes.
         
         Args:
             audio_data: Audio data as bytes
             
         Returns:
-            True if format is supported, False otherwise
+            Format name (e.g. "WAV", "MP3", "OGG", "FLAC"), or None if unrecognized
         """
-        if len(audio_data) < 12:
-            return False
+        for name, signatures in AUDIO_SIGNATURES:
+            if all(audio_data.startswith(magic, offset) for offset, magic in signatures):
+                return name
         
-        # Check for WAV format
-        if audio_data[:4] == b'RIFF' and audio_data[8:12] == b'WAVE':
-            return True
+        return None
+
+
+# Default utterance segmentation for streamed microphone audio (seconds): an
+# utterance ends after this much speech followed by a pause, or at the cap
+STREAM_MIN_SPEECH_SECONDS = 0.5
+STREAM_PAUSE_SECONDS = 0.6
+STREAM_MAX_SECONDS = 30.0
+STREAM_SILENCE_THRESHOLD = 0.01
+
+
+class StreamBuffer:
+    """
+    Buffers streamed audio and cuts it into utterances at pauses.
+    
+    Each stream (a user session, a dictation) keeps its own buffer; the
+    speech engines and the UI share this one segmentation policy.
+    
+    Attributes:
+        sample_rate: Sample rate of the pushed audio in Hz
+        min_speech_seconds: Speech needed before a pause ends an utterance
+        pause_seconds: Trailing silence that ends an utterance
+        max_seconds: Buffered length at which an utterance is cut regardless
+        tail_seconds: Audio kept after a cut as context for the next utterance
+        silence_threshold: RMS level below which a chunk counts as silence
+    """
+    
+    def __init__(
+        self,
+        sample_rate: int,
+        min_speech_seconds: float = STREAM_MIN_SPEECH_SECONDS,
+        pause_seconds: float = STREAM_PAUSE_SECONDS,
+        max_seconds: float = STREAM_MAX_SECONDS,
+        tail_seconds: float = 0.0,
+        silence_threshold: float = STREAM_SILENCE_THRESHOLD
+    ) -> None:
+        """
+        Initialize an empty stream buffer.
         
-        # Check for other formats (can be extended)
-        # MP3, OGG, etc.
+        Args:
+            sample_rate: Sample rate of the pushed audio in Hz
+            min_speech_seconds: Speech needed before a pause ends an utterance
+            pause_seconds: Trailing silence that ends an utterance
+            max_seconds: Buffered length at which an utterance is cut regardless
+            tail_seconds: Audio kept after a cut as context for the next utterance
+            silence_threshold: RMS level below which a chunk counts as silence
+        """
+        self.sample_rate = sample_rate
+        self.min_speech_seconds = min_speech_seconds
+        self.pause_seconds = pause_seconds
+        self.max_seconds = max_seconds
+        self.tail_seconds = tail_seconds
+        self.silence_threshold = silence_threshold
+        self.reset()
+    
+    @property
+    def seconds(self) -> float:
+        """Length of the buffered audio in seconds."""
+        return self._samples / self.sample_rate
+    
+    @property
+    def has_speech(self) -> bool:
+        """Whether the buffer holds anything besides trailing silence."""
+        return self._samples > self._silent_samples
+    
+    def push(self, chunk: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Add a chunk and return a finished utterance if this chunk ends one.
         
-        return False
+        Args:
+            chunk: Audio samples at ``sample_rate``, shaped (n,) or (n, channels)
+            
+        Returns:
+            Mono float32 samples of the utterance, or None if it continues
+        """
+        chunk = AudioUtils.to_mono_float32(chunk)
+        if chunk.size == 0:
+            return None
+        
+        self._chunks.append(chunk)
+        self._samples += chunk.size
+        if AudioUtils.is_silent(chunk, self.silence_threshold):
+            self._silent_samples += chunk.size
+        else:
+            self._silent_samples = 0
+        
+        speech_samples = self._samples - self._silent_samples
+        paused = (
+            speech_samples >= self.min_speech_seconds * self.sample_rate
+            and self._silent_samples >= self.pause_seconds * self.sample_rate
+        )
+        if not paused and self._samples < self.max_seconds * self.sample_rate:
+            return None
+        
+        return self._cut()
+    
+    def flush(self) -> Optional[np.ndarray]:
+        """
+        Return whatever is buffered when the stream ends, and empty the buffer.
+        
+        Returns:
+            Mono float32 samples, or None if only silence was buffered
+        """
+        audio = np.concatenate(self._chunks) if self.has_speech else None
+        self.reset()
+        return audio
+    
+    def reset(self) -> None:
+        """Discard all buffered audio."""
+        self._chunks: List[np.ndarray] = []
+        self._samples = 0
+        self._silent_samples = 0
+    
+    def _cut(self) -> np.ndarray:
+        """Take the buffered utterance, keeping ``tail_seconds`` as context."""
+        window = np.concatenate(self._chunks)
+        tail_size = int(self.tail_seconds * self.sample_rate)
+        if tail_size:
+            tail = window[-tail_size:].copy()
+            self._chunks = [tail]
+            self._samples = tail.size
+            self._silent_samples = min(self._silent_samples, tail.size)
+        else:
+            self.reset()
+        return window
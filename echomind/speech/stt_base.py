@@ -7,7 +7,7 @@ All STT implementations should inherit from this base class.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Union, List
 import numpy as np
 
 
@@ -53,6 +53,21 @@ class STTProcessor(ABC):
         """
         pass
     
+    def transcribe_batch(self, clips: List[Union[bytes, np.ndarray, str]]) -> List[str]:
+        """
+        Transcribe several independent audio clips.
+        
+        The default implementation transcribes clips one by one; engines with
+        batched inference should override it.
+        
+        Args:
+            clips: Audio clips in any format accepted by :meth:`transcribe`
+            
+        Returns:
+            Transcribed text for each clip, in the same order
+        """
+        return [self.transcribe(clip) for clip in clips]
+    
     @abstractmethod
     def transcribe_streaming(self, audio_chunk: bytes) -> Optional[str]:
         """
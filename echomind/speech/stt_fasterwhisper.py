@@ -7,13 +7,93 @@ which is an optimized implementation of OpenAI's Whisper model.
 """
 
 import io
-import tempfile
-from typing import Optional, Union
+import os
+import threading
+import zlib
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 import numpy as np
 from loguru import logger
 
+from .audio_utils import AudioUtils, StreamBuffer
 from .stt_base import STTProcessor
 
+# Whisper models expect 16 kHz mono float32 input, in windows of 30 s
+WHISPER_SAMPLE_RATE = 16000
+WHISPER_CHUNK_SECONDS = 30
+
+# Audio kept after each streamed window as context for the next one (seconds);
+# windows are cut at pauses or at Whisper's 30 s limit (see StreamBuffer)
+STREAM_TAIL_SECONDS = 0.5
+
+# Quality checks for batched results, matching WhisperModel.transcribe's defaults:
+# a clip is silence if no_speech_prob is high and the text is not confident;
+# a low average log-probability or repetitive (highly compressible) text is
+# re-transcribed with transcribe()'s temperature fallback
+NO_SPEECH_THRESHOLD = 0.6
+LOG_PROB_THRESHOLD = -1.0
+COMPRESSION_RATIO_THRESHOLD = 2.4
+
+# (device, compute_type) fallbacks when a CUDA device is present
+CUDA_PREFERENCES = [("cuda", "float16"), ("cuda", "int8_float16")]
+
+
+def _compression_ratio(text: str) -> float:
+    """gzip-style compression ratio of ``text``; high values mean repetitive output."""
+    text_bytes = text.encode("utf-8")
+    return len(text_bytes) / len(zlib.compress(text_bytes)) if text_bytes else 0.0
+
+
+# Serializes model loads so concurrent initialize() calls share one copy
+_model_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4)
+def _cached_whisper_model(model_size: str, device: str, compute_type: str):
+    """Load a WhisperModel once per (model_size, device, compute_type)."""
+    from faster_whisper import WhisperModel
+    
+    return WhisperModel(
+        model_size,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=max(1, (os.cpu_count() or 2) // 2) if device == "cpu" else 0,
+        num_workers=1
+    )
+
+
+def _load_whisper_model(model_size: str, device: str, compute_type: str):
+    """
+    Get the process-wide WhisperModel for a configuration, loading it on first use.
+    
+    Every FasterWhisperSTT with the same settings shares one model instead of
+    holding its own copy of the weights.
+    
+    Args:
+        model_size: Whisper model size
+        device: Inference device (cpu or cuda)
+        compute_type: CTranslate2 quantization
+        
+    Returns:
+        Loaded WhisperModel
+    """
+    with _model_lock:
+        return _cached_whisper_model(model_size, device, compute_type)
+
+
+def _cuda_available() -> bool:
+    """
+    Check for a CUDA device through CTranslate2, the backend faster-whisper runs on.
+    
+    Returns:
+        True if at least one CUDA device is usable
+    """
+    try:
+        import ctranslate2
+        return ctranslate2.get_cuda_device_count() > 0
+    except Exception:
+        return False
+
 
 class FasterWhisperSTT(STTProcessor):
     """
@@ -24,17 +104,31 @@ class FasterWhisperSTT(STTProcessor):
     OpenAI's Whisper model.
     """
     
-    def __init__(self, model_size: str = "small", language: str = "en") -> None:
+    def __init__(
+        self,
+        model_size: str = "small",
+        language: str = "en",
+        compute_type: str = "int8",
+        device: str = "auto"
+    ) -> None:
         """
         Initialize the Faster-Whisper STT processor.
         
         Args:
             model_size: Whisper model size (tiny, base, small, medium, large-v2)
             language: Language code for speech recognition
+            compute_type: CTranslate2 quantization (int8, int8_float16, float16, float32)
+            device: Inference device (cpu, cuda, auto); auto prefers CUDA when present
         """
         super().__init__(model_size, language)
+        self.compute_type = compute_type
+        self.device = device
         self.model = None
         self.transcriber = None
+        self._prompt_cache: Dict[str, Tuple[Any, List[int]]] = {}  # language -> (tokenizer, prompt)
+        
+        # Default stream for transcribe_streaming calls that don't pass their own
+        self._stream = self.new_stream()
         
     def initialize(self) -> None:
         """
@@ -43,16 +137,24 @@ class FasterWhisperSTT(STTProcessor):
         Loads the specified model and prepares it for transcription.
         """
         try:
-            from faster_whisper import WhisperModel
+            import faster_whisper  # noqa: F401  (fail fast with a clear install hint)
             
-            logger.info(f"Loading Faster-Whisper model: {self.model_size}")
-            
-            # Load the model with CPU inference (can be changed to GPU)
-            self.model = WhisperModel(
-                self.model_size,
-                device="cpu",  # Use "cuda" for GPU
-                compute_type="int8"  # Use "float16" for better accuracy
-            )
+            last_error = None
+            for device, compute_type in self._device_candidates():
+                logger.info(f"Loading Faster-Whisper model: {self.model_size} ({device}, {compute_type})")
+                try:
+                    self.model = _load_whisper_model(self.model_size, device, compute_type)
+                except Exception as e:
+                    # e.g. float16 unsupported on this GPU; try the next option
+                    logger.warning(f"Could not load on {device}/{compute_type}: {e}")
+                    last_error = e
+                    continue
+                
+                self.device = device
+                self.compute_type = compute_type
+                break
+            else:
+                raise last_error
             
             self.is_initialized = True
             logger.info("Faster-Whisper model loaded successfully")
@@ -64,6 +166,27 @@ class FasterWhisperSTT(STTProcessor):
             logger.error(f"Failed to initialize Faster-Whisper: {e}")
             raise
     
+    def _device_candidates(self) -> List[Tuple[str, str]]:
+        """
+        Build the (device, compute_type) options to try, best first.
+        
+        Returns:
+            List of device and compute type pairs
+        """
+        if self.device != "auto":
+            return [(self.device, self.compute_type)]
+        
+        # The configured compute type comes first on each device; the defaults
+        # are only fallbacks for when it fails to load there
+        candidates = []
+        if _cuda_available():
+            candidates.append(("cuda", self.compute_type))
+            candidates.extend(CUDA_PREFERENCES)
+        candidates.append(("cpu", self.compute_type))
+        # int8 halves memory and roughly doubles CPU throughput via CTranslate2
+        candidates.append(("cpu", "int8"))
+        return list(dict.fromkeys(candidates))
+    
     def transcribe(self, audio_data: Union[bytes, np.ndarray, str]) -> str:
         """
         Transcribe audio data to text using Faster-Whisper.
@@ -78,76 +201,237 @@ class FasterWhisperSTT(STTProcessor):
             self.initialize()
         
         try:
-            # Handle different input types
-            if isinstance(audio_data, str):
-                # File path
-                segments, _ = self.model.transcribe(
-                    audio_data,
-                    language=self.language if self.language != "auto" else None,
-                    beam_size=5
-                )
-            elif isinstance(audio_data, bytes):
-                # Audio bytes - save to temporary file
-                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                    temp_file.write(audio_data)
-                    temp_file_path = temp_file.name
-                
-                try:
-                    segments, _ = self.model.transcribe(
-                        temp_file_path,
-                        language=self.language if self.language != "auto" else None,
-                        beam_size=5
-                    )
-                finally:
-                    # Clean up temporary file
-                    import os
-                    os.unlink(temp_file_path)
-            elif isinstance(audio_data, np.ndarray):
-                # Numpy array - save to temporary file
-                import soundfile as sf
-                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                    sf.write(temp_file.name, audio_data, 16000)
-                    temp_file_path = temp_file.name
-                
-                try:
-                    segments, _ = self.model.transcribe(
-                        temp_file_path,
-                        language=self.language if self.language != "auto" else None,
-                        beam_size=5
-                    )
-                finally:
-                    # Clean up temporary file
-                    import os
-                    os.unlink(temp_file_path)
-            else:
-                raise ValueError(f"Unsupported audio data type: {type(audio_data)}")
+            source = self._prepare_audio(audio_data)
             
-            # Combine all segments into a single text
-            transcribed_text = " ".join([segment.text for segment in segments])
+            segments, _ = self.model.transcribe(
+                source,
+                language=self.language if self.language != "auto" else None,
+                beam_size=5
+            )
+            
+            # Segments are decoded lazily; collect each text as it is produced
+            parts = []
+            for segment in segments:
+                parts.append(segment.text)
+                logger.trace(f"Segment [{segment.start:.1f}s-{segment.end:.1f}s]: {segment.text}")
             
+            transcribed_text = " ".join(parts).strip()
             logger.debug(f"Transcribed {len(transcribed_text)} characters")
-            return transcribed_text.strip()
+            return transcribed_text
             
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
             return ""
     
-    def transcribe_streaming(self, audio_chunk: bytes) -> Optional[str]:
+    def transcribe_batch(self, clips: List[Union[bytes, np.ndarray, str]]) -> List[str]:
+        """
+        Transcribe several short clips with one batched encoder/decoder call.
+        
+        Each clip is turned into a 30 s log-mel window; the windows are
+        stacked, encoded together and decoded with a shared prompt. Clips
+        judged silent are returned empty, and clips decoded with low
+        confidence are re-transcribed with :meth:`transcribe`, as
+        faster-whisper's own no-speech and temperature-fallback checks would.
+        Falls back to sequential :meth:`transcribe` when the language must be
+        detected, a clip is longer than one window or cannot be decoded in
+        memory, or the batched call fails.
+        
+        Args:
+            clips: Audio clips in any format accepted by :meth:`transcribe`
+            
+        Returns:
+            Transcribed text for each clip, in the same order
+        """
+        if len(clips) < 2 or self.language == "auto":
+            return super().transcribe_batch(clips)
+        
+        if not self.is_initialized:
+            self.initialize()
+        
+        try:
+            audios = [self._prepare_audio(clip) for clip in clips]
+            if any(
+                not isinstance(audio, np.ndarray) or audio.size > WHISPER_CHUNK_SECONDS * WHISPER_SAMPLE_RATE
+                for audio in audios
+            ):
+                return super().transcribe_batch(clips)
+            
+            from faster_whisper.audio import pad_or_trim
+            
+            n_frames = self.model.feature_extractor.nb_max_frames
+            features = np.stack([
+                pad_or_trim(self.model.feature_extractor(audio)[:, :n_frames], n_frames)
+                for audio in audios
+            ]).astype(np.float32, copy=False)
+            
+            tokenizer, prompt = self._batch_prompt()
+            
+            encoder_output = self.model.encode(features)
+            results = self.model.model.generate(
+                encoder_output,
+                [prompt] * len(audios),
+                beam_size=5,
+                max_length=self.model.max_length,
+                suppress_blank=True,
+                suppress_tokens=[-1],
+                return_scores=True,
+                return_no_speech_prob=True
+            )
+            
+            texts = [self._checked_batch_text(result, tokenizer) for result in results]
+            
+            retry = [i for i, text in enumerate(texts) if text is None]
+            for i in retry:
+                texts[i] = self.transcribe(clips[i])
+            
+            logger.debug(f"Batch-transcribed {len(texts)} clips ({len(retry)} re-transcribed)")
+            return texts
+            
+        except Exception as e:
+            logger.warning(f"Batched transcription failed, transcribing sequentially: {e}")
+            return super().transcribe_batch(clips)
+    
+    @staticmethod
+    def _checked_batch_text(result: Any, tokenizer: Any) -> Optional[str]:
+        """
+        Decode one batched result, applying faster-whisper's quality checks.
+        
+        Args:
+            result: CTranslate2 generation result with scores and no_speech_prob
+            tokenizer: faster-whisper Tokenizer used for the prompt
+            
+        Returns:
+            The transcribed text, "" for silence, or None if the clip should be
+            re-transcribed with temperature fallback
+        """
+        sequence = result.sequences_ids[0]
+        tokens = [token for token in sequence if token < tokenizer.eot]
+        text = tokenizer.decode(tokens).strip()
+        
+        # Same normalization as faster-whisper (length_penalty=1)
+        avg_logprob = result.scores[0] * len(sequence) / (len(sequence) + 1)
+        
+        if result.no_speech_prob > NO_SPEECH_THRESHOLD and avg_logprob <= LOG_PROB_THRESHOLD:
+            return ""
+        if avg_logprob < LOG_PROB_THRESHOLD or _compression_ratio(text) > COMPRESSION_RATIO_THRESHOLD:
+            return None
+        return text
+    
+    def _batch_prompt(self) -> Tuple[Any, List[int]]:
+        """
+        Get the tokenizer and decoder prompt for batched transcription.
+        
+        Both depend only on the model and language, so they are built once per
+        language instead of on every batch. (The mel filterbank needs no such
+        cache: it lives in the model's FeatureExtractor, which is shared
+        process-wide through the model cache.)
+        
+        Returns:
+            Tuple of (tokenizer, prompt token ids)
+        """
+        cached = self._prompt_cache.get(self.language)
+        if cached is None:
+            from faster_whisper.tokenizer import Tokenizer
+            
+            tokenizer = Tokenizer(
+                self.model.hf_tokenizer,
+                self.model.model.is_multilingual,
+                task="transcribe",
+                language=self.language
+            )
+            prompt = self.model.get_prompt(tokenizer, [], without_timestamps=True)
+            cached = self._prompt_cache[self.language] = (tokenizer, prompt)
+        return cached
+    
+    def _prepare_audio(self, audio_data: Union[bytes, np.ndarray, str]) -> Union[np.ndarray, str, io.BytesIO]:
+        """
+        Convert input audio to something faster-whisper can consume.
+        
+        Hands faster-whisper an in-memory float32 array where possible,
+        skipping the tempfile write and the ffmpeg decode.
+        
+        Args:
+            audio_data: Audio data in bytes, numpy array, or file path
+            
+        Returns:
+            Mono float32 samples at 16 kHz, a file path, or a file-like object to decode
+        """
+        if isinstance(audio_data, str):
+            # File path
+            return audio_data
+        elif isinstance(audio_data, bytes):
+            samples = AudioUtils.bytes_to_numpy(audio_data, WHISPER_SAMPLE_RATE)
+            if samples.size:
+                return AudioUtils.to_mono_float32(samples)
+            # Container soundfile cannot read (e.g. webm): let faster-whisper decode it
+            return io.BytesIO(audio_data)
+        elif isinstance(audio_data, np.ndarray):
+            # Numpy array, assumed to be sampled at 16 kHz
+            return AudioUtils.to_mono_float32(audio_data)
+        else:
+            raise ValueError(f"Unsupported audio data type: {type(audio_data)}")
+    
+    @staticmethod
+    def new_stream() -> StreamBuffer:
+        """
+        Create streaming state for one audio stream (e.g. one user session).
+        
+        Returns:
+            Empty stream buffer at Whisper's sample rate
+        """
+        return StreamBuffer(
+            WHISPER_SAMPLE_RATE,
+            max_seconds=WHISPER_CHUNK_SECONDS,
+            tail_seconds=STREAM_TAIL_SECONDS
+        )
+    
+    def transcribe_streaming(
+        self,
+        audio_chunk: Union[bytes, np.ndarray],
+        stream: Optional[StreamBuffer] = None
+    ) -> Optional[str]:
         """
         Transcribe audio chunk for streaming applications.
         
-        Note: Faster-Whisper doesn't support true streaming, so this
-        is a simplified implementation that processes chunks.
+        Faster-Whisper doesn't support true streaming, so chunks are buffered
+        and the buffer is transcribed once it holds an utterance ending in a
+        pause, or reaches Whisper's 30 s window. The last
+        ``STREAM_TAIL_SECONDS`` are kept as context for the next window.
         
         Args:
-            audio_chunk: Audio data chunk
+            audio_chunk: Audio data chunk: WAV bytes, raw 16-bit PCM bytes at
+                16 kHz, or a numpy array at 16 kHz
+            stream: Per-stream state from :meth:`new_stream`; defaults to
+                this processor's own stream
             
         Returns:
-            Partial transcription or None if not enough data
+            Transcription of the flushed window, or None if not enough data
         """
-        # For now, return None as streaming requires more complex implementation
-        # This could be enhanced with a buffer-based approach
-        return None
+        if stream is None:
+            stream = self._stream
+        
+        if isinstance(audio_chunk, bytes):
+            # Only a RIFF/WAVE header marks a file; raw PCM may start with any
+            # bytes, including other formats' sync words
+            if AudioUtils.validate_audio_format(audio_chunk) == "WAV":
+                chunk = AudioUtils.bytes_to_numpy(audio_chunk, WHISPER_SAMPLE_RATE)
+            else:
+                chunk = np.frombuffer(audio_chunk, dtype='<i2', count=len(audio_chunk) // 2)
+        else:
+            chunk = audio_chunk
+        
+        window = stream.push(chunk)
+        if window is None:
+            return None
+        
+        text = self.transcribe(window)
+        return text or None
+    
+    def reset_streaming(self) -> None:
+        """
+        Discard any audio buffered by :meth:`transcribe_streaming` on the default stream.
+        """
+        self._stream.reset()
     
     def get_model_info(self) -> dict:
         """
@@ -159,9 +443,9 @@ class FasterWhisperSTT(STTProcessor):
         info = super().get_model_info()
         info.update({
             "engine": "faster-whisper",
-            "device": "cpu",  # or "cuda" if using GPU
-            "compute_type": "int8",
-            "supports_streaming": False
+            "device": self.device,
+            "compute_type": self.compute_type,
+            "supports_streaming": True
         })
         return info
     
@@ -169,8 +453,9 @@ class FasterWhisperSTT(STTProcessor):
         """
         Clean up Faster-Whisper resources.
         """
-        if self.model:
-            del self.model
-            self.model = None
+        # Only drop our reference; the shared model stays cached for other instances
+        self.model = None
+        self._prompt_cache.clear()
+        self.reset_streaming()
         super().cleanup()
         logger.info("Faster-Whisper resources cleaned up")
@@ -6,9 +6,12 @@ This module defines the base interface for text-to-speech processing.
 All TTS implementations should inherit from this base class.
 """
 
+import re
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, Union
-import io
+from typing import Dict, Any, Iterator
+
+# Sentence boundaries used to split text for streaming synthesis
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
 
 
 class TTSProcessor(ABC):
@@ -53,6 +56,27 @@ class TTSProcessor(ABC):
         """
         pass
     
+    def synthesize_stream(self, text: str) -> Iterator[bytes]:
+        """
+        Convert text to speech one sentence at a time.
+        
+        The first chunk is available after the first sentence has been
+        synthesized instead of after the whole text. Engines with native
+        streaming should override this.
+        
+        Args:
+            text: Text to convert to speech
+            
+        Yields:
+            Audio data as bytes, one chunk per sentence
+        """
+        for sentence in _SENTENCE_SPLIT_RE.split(text.strip()):
+            if not sentence:
+                continue
+            audio_data = self.synthesize(sentence)
+            if audio_data:
+                yield audio_data
+    
     @abstractmethod
     def get_available_voices(self) -> list[str]:
         """
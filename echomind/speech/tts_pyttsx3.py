@@ -4,14 +4,124 @@ pyttsx3 Text-to-Speech Implementation
 
 This module provides text-to-speech functionality using pyttsx3,
 which is a cross-platform TTS library that uses system voices.
+
+The pyttsx3 engine runs in a dedicated worker process: ``runAndWait`` is a
+blocking, non-reentrant event loop, so keeping it out of the caller's process
+makes synthesis safe to call from any thread and lets a hung or crashed
+engine be restarted.
 """
 
-import io
-from typing import List
+import importlib.util
+import multiprocessing as mp
+import os
+import queue
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
 from loguru import logger
 
 from .tts_base import TTSProcessor
 
+# Seconds to wait for the worker to start and for a single job to finish
+WORKER_START_TIMEOUT = 15.0
+JOB_TIMEOUT = 30.0
+
+# Extra seconds allowed per character of text when rendering speech at speed 1.0;
+# about 10 characters per second, below normal speaking rate, so backends that
+# render in real time still finish
+SAY_SECONDS_PER_CHAR = 0.1
+
+# Seconds between worker liveness checks while waiting for a result
+_POLL_INTERVAL = 0.5
+
+
+def _render_to_bytes(engine: Any, text: str) -> bytes:
+    """
+    Render speech with pyttsx3 and return the WAV file contents.
+    
+    pyttsx3 can only write to a path, so the path points at RAM where
+    possible: an anonymous memfd on Linux, else a file in /dev/shm, else a
+    regular temporary file.
+    
+    Args:
+        engine: pyttsx3 engine
+        text: Text to convert to speech
+        
+    Returns:
+        Audio data as bytes
+    """
+    if hasattr(os, "memfd_create"):
+        fd = os.memfd_create("echomind-tts", 0)
+        try:
+            path = f"/proc/self/fd/{fd}"
+            engine.save_to_file(text, path)
+            engine.runAndWait()
+            with open(path, 'rb') as f:  # Fresh file description, reads from offset 0
+                return f.read()
+        finally:
+            os.close(fd)
+    
+    directory = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    with tempfile.NamedTemporaryFile(suffix=".wav", dir=directory, delete=False) as temp_file:
+        temp_file_path = temp_file.name
+    
+    try:
+        engine.save_to_file(text, temp_file_path)
+        engine.runAndWait()
+        with open(temp_file_path, 'rb') as f:
+            return f.read()
+    finally:
+        if os.path.exists(temp_file_path):
+            os.unlink(temp_file_path)
+
+
+def _engine_worker(jobs: "mp.Queue", results: "mp.Queue") -> None:
+    """
+    Worker process loop owning the pyttsx3 engine.
+    
+    Jobs are ``(job_id, op, payload)`` tuples; each is answered with
+    ``(job_id, ok, value)``. A ``None`` job stops the worker.
+    
+    Supported operations:
+        say: payload ``text``; returns the rendered WAV bytes
+        set: payload ``(name, value)``; sets an engine property
+        voices: returns ``[(id, name), ...]`` for the installed voices
+    """
+    try:
+        import pyttsx3
+        engine = pyttsx3.init()
+    except Exception as e:
+        results.put((0, False, f"{type(e).__name__}: {e}"))
+        return
+    results.put((0, True, None))
+    
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        
+        job_id, op, payload = job
+        try:
+            if op == "say":
+                value = _render_to_bytes(engine, payload)
+            elif op == "set":
+                name, prop = payload
+                engine.setProperty(name, prop)
+                value = None
+            elif op == "voices":
+                value = [(v.id, v.name) for v in engine.getProperty('voices')]
+            else:
+                raise ValueError(f"Unknown operation: {op}")
+            results.put((job_id, True, value))
+        except Exception as e:
+            results.put((job_id, False, f"{type(e).__name__}: {e}"))
+    
+    try:
+        engine.stop()
+    except Exception:
+        pass
+
 
 class Pyttsx3TTS(TTSProcessor):
     """
@@ -22,6 +132,11 @@ class Pyttsx3TTS(TTSProcessor):
     the voices installed on the system.
     """
     
+    # Installed system voices as (id, name), shared by all instances once enumerated
+    _voice_cache: Optional[List[Tuple[str, str]]] = None
+    # Voice query -> matching (id, name), or None if nothing matched
+    _voice_index: Dict[str, Optional[Tuple[str, str]]] = {}
+    
     def __init__(self, voice: str = "default", speed: float = 1.0) -> None:
         """
         Initialize the pyttsx3 TTS processor.
@@ -31,33 +146,39 @@ class Pyttsx3TTS(TTSProcessor):
             speed: Speech rate (1.0 = normal speed)
         """
         super().__init__(voice, speed)
-        self.engine = None
+        self.engine = None  # Worker process running the pyttsx3 engine
+        self._jobs = None
+        self._results = None
+        self._job_id = 0
+        self._lock = threading.Lock()
+        
+        # Engine properties, re-applied whenever the worker is (re)started
+        self._properties = {
+            'rate': int(200 * speed),  # Speed (words per minute)
+            'volume': 0.9  # Volume (0.0 to 1.0)
+        }
         
     def initialize(self) -> None:
         """
         Initialize the pyttsx3 engine.
         
-        Loads the TTS engine and prepares it for synthesis.
+        Starts the worker process, which loads the TTS engine and prepares it for synthesis.
+        Does nothing if the worker is already running, so concurrent callers
+        (warmup, status, first request) share one worker.
         """
         try:
-            import pyttsx3
-            
-            logger.info("Initializing pyttsx3 TTS engine")
+            if importlib.util.find_spec("pyttsx3") is None:
+                raise ImportError("No module named 'pyttsx3'")
             
-            # Initialize the TTS engine
-            self.engine = pyttsx3.init()
-            
-            # Set properties
-            self.engine.setProperty('rate', int(200 * self.speed))  # Speed (words per minute)
-            self.engine.setProperty('volume', 0.9)  # Volume (0.0 to 1.0)
+            with self._lock:
+                if self.engine is not None and self.engine.is_alive():
+                    return
+                logger.info("Initializing pyttsx3 TTS engine")
+                self._start_worker()
             
             # Set voice if specified
             if self.voice != "default":
-                voices = self.engine.getProperty('voices')
-                for v in voices:
-                    if self.voice in v.name.lower():
-                        self.engine.setProperty('voice', v.id)
-                        break
+                self._apply_voice(self.voice)
             
             self.is_initialized = True
             logger.info("pyttsx3 TTS engine initialized successfully")
@@ -69,6 +190,212 @@ class Pyttsx3TTS(TTSProcessor):
             logger.error(f"Failed to initialize pyttsx3: {e}")
             raise
     
+    def _start_worker(self) -> None:
+        """
+        Start a fresh worker process and apply the current engine properties.
+        
+        Must be called with ``self._lock`` held.
+        """
+        self._stop_worker()
+        
+        ctx = mp.get_context("spawn")
+        self._jobs = ctx.Queue()
+        self._results = ctx.Queue()
+        self.engine = ctx.Process(
+            target=_engine_worker,
+            args=(self._jobs, self._results),
+            name="pyttsx3-worker",
+            daemon=True
+        )
+        self.engine.start()
+        
+        try:
+            _, ok, error = self._receive(WORKER_START_TIMEOUT)
+        except (queue.Empty, EOFError) as e:
+            self._stop_worker()
+            raise RuntimeError(f"pyttsx3 worker did not start: {e or 'timed out'}")
+        if not ok:
+            self._stop_worker()
+            raise RuntimeError(f"pyttsx3 worker failed to start: {error}")
+        
+        for name, value in self._properties.items():
+            self._send("set", (name, value), restart=False)
+    
+    def _stop_worker(self) -> None:
+        """
+        Stop the worker process if it is running.
+        
+        Must be called with ``self._lock`` held.
+        """
+        if self.engine is None:
+            return
+        
+        if self.engine.is_alive():
+            try:
+                self._jobs.put(None)
+                self.engine.join(timeout=2.0)
+            except Exception:
+                pass
+            if self.engine.is_alive():
+                self.engine.terminate()
+                self.engine.join(timeout=2.0)
+        
+        self.engine = None
+        self._jobs = None
+        self._results = None
+    
+    def _send(self, op: str, payload: Any = None, timeout: float = JOB_TIMEOUT, restart: bool = True) -> Any:
+        """
+        Run one job in the worker and wait for its result.
+        
+        Must be called with ``self._lock`` held. A dead worker is restarted
+        before the job; a worker that times out is restarted afterwards.
+        
+        Args:
+            op: Operation name (say, set, voices)
+            payload: Operation arguments
+            timeout: Seconds to wait for the result
+            restart: Whether a missing or dead worker may be restarted first
+            
+        Returns:
+            The operation's result
+        """
+        if restart and (self.engine is None or not self.engine.is_alive()):
+            if self.engine is not None:
+                logger.warning(f"pyttsx3 worker exited (code {self.engine.exitcode}); restarting")
+            self._start_worker()
+        
+        self._job_id += 1
+        job_id = self._job_id
+        self._jobs.put((job_id, op, payload))
+        
+        while True:
+            try:
+                result_id, ok, value = self._receive(timeout)
+            except queue.Empty:
+                logger.warning(f"pyttsx3 worker timed out on '{op}'; restarting")
+                self._stop_worker()
+                raise TimeoutError(f"pyttsx3 '{op}' timed out after {timeout}s")
+            except EOFError as e:
+                self._stop_worker()
+                raise RuntimeError(f"pyttsx3 worker crashed during '{op}': {e}")
+            if result_id == job_id:
+                break
+            # Stale answer for an earlier job; discard it
+        
+        if not ok:
+            raise RuntimeError(value)
+        return value
+    
+    def _receive(self, timeout: float) -> Tuple[int, bool, Any]:
+        """
+        Wait for the next worker message, noticing if the worker dies meanwhile.
+        
+        Args:
+            timeout: Seconds to wait
+            
+        Returns:
+            ``(job_id, ok, value)`` message from the worker
+            
+        Raises:
+            queue.Empty: If nothing arrived within the timeout
+            EOFError: If the worker exited without answering
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                return self._results.get(timeout=min(_POLL_INTERVAL, max(0.0, deadline - time.monotonic())))
+            except queue.Empty:
+                if not self.engine.is_alive():
+                    raise EOFError(f"worker exited with code {self.engine.exitcode}")
+                if time.monotonic() >= deadline:
+                    raise
+    
+    def _call(self, op: str, payload: Any = None, timeout: float = JOB_TIMEOUT) -> Any:
+        """
+        Run one job in the worker, serialized with other callers.
+        
+        Args:
+            op: Operation name (say, set, voices)
+            payload: Operation arguments
+            timeout: Seconds to wait for the result
+            
+        Returns:
+            The operation's result
+        """
+        with self._lock:
+            return self._send(op, payload, timeout=timeout)
+    
+    def _say_timeout(self, text: str) -> float:
+        """
+        Seconds to allow for rendering ``text``, growing with its length.
+        
+        Args:
+            text: Text to be spoken
+            
+        Returns:
+            JOB_TIMEOUT plus time per character, scaled for slower speech
+        """
+        return JOB_TIMEOUT + len(text) * SAY_SECONDS_PER_CHAR / max(self.speed, 0.1)
+    
+    def _set_property(self, name: str, value: Any) -> None:
+        """
+        Set an engine property now and on any future worker restart.
+        
+        Args:
+            name: pyttsx3 property name
+            value: Property value
+        """
+        with self._lock:
+            self._properties[name] = value
+            self._send("set", (name, value))
+    
+    def _voices(self) -> List[Tuple[str, str]]:
+        """
+        Get the installed voices, enumerating them only once per process.
+        
+        Returns:
+            List of ``(id, name)`` pairs
+        """
+        voices = Pyttsx3TTS._voice_cache
+        if voices is None:
+            voices = self._call("voices")
+            Pyttsx3TTS._voice_index = {}
+            Pyttsx3TTS._voice_cache = voices
+        return voices
+    
+    def _find_voice(self, voice: str) -> Optional[Tuple[str, str]]:
+        """
+        Find the first installed voice whose name contains ``voice``.
+        
+        Args:
+            voice: Voice name to search for
+            
+        Returns:
+            ``(id, name)`` of the matching voice, or None
+        """
+        voices = self._voices()
+        index = Pyttsx3TTS._voice_index
+        voice = voice.lower()
+        if voice not in index:
+            index[voice] = next(
+                ((voice_id, name) for voice_id, name in voices if voice in name.lower()),
+                None
+            )
+        return index[voice]
+    
+    def _apply_voice(self, voice: str) -> None:
+        """
+        Select the installed voice matching ``voice``, if any.
+        
+        Args:
+            voice: Voice name to use
+        """
+        match = self._find_voice(voice)
+        if match:
+            self._set_property('voice', match[0])
+            logger.info(f"Voice set to: {match[1]}")
+    
     def synthesize(self, text: str) -> bytes:
         """
         Convert text to speech using pyttsx3.
@@ -83,31 +410,12 @@ class Pyttsx3TTS(TTSProcessor):
             self.initialize()
         
         try:
-            # Note: pyttsx3 doesn't directly return audio bytes
-            # For now, we'll use a workaround by saving to a temporary file
-            import tempfile
-            import os
-            
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                temp_file_path = temp_file.name
+            # Note: pyttsx3 doesn't directly return audio bytes; the worker
+            # renders to an in-memory file and sends back its contents
+            audio_data = self._call("say", text, timeout=self._say_timeout(text))
             
-            try:
-                # Save speech to temporary file
-                self.engine.save_to_file(text, temp_file_path)
-                self.engine.runAndWait()
-                
-                # Read the audio file
-                with open(temp_file_path, 'rb') as f:
-                    audio_data = f.read()
-                
-                logger.debug(f"Synthesized {len(text)} characters to {len(audio_data)} bytes")
-                return audio_data
-                
-            finally:
-                # Clean up temporary file
-                if os.path.exists(temp_file_path):
-                    os.unlink(temp_file_path)
+            logger.debug(f"Synthesized {len(text)} characters to {len(audio_data)} bytes")
+            return audio_data
                     
         except Exception as e:
             logger.error(f"Speech synthesis failed: {e}")
@@ -121,11 +429,10 @@ class Pyttsx3TTS(TTSProcessor):
             List of available voice names
         """
         try:
-            if not self.engine:
+            if Pyttsx3TTS._voice_cache is None and not self.is_initialized:
                 self.initialize()
             
-            voices = self.engine.getProperty('voices')
-            voice_names = [voice.name for voice in voices]
+            voice_names = [name for _, name in self._voices()]
             
             # Add default option
             if "default" not in voice_names:
@@ -146,14 +453,9 @@ class Pyttsx3TTS(TTSProcessor):
         """
         super().set_voice(voice)
         
-        if self.engine and self.is_initialized:
+        if self.is_initialized:
             try:
-                voices = self.engine.getProperty('voices')
-                for v in voices:
-                    if voice in v.name.lower():
-                        self.engine.setProperty('voice', v.id)
-                        logger.info(f"Voice set to: {v.name}")
-                        break
+                self._apply_voice(voice)
             except Exception as e:
                 logger.error(f"Failed to set voice: {e}")
     
@@ -166,11 +468,13 @@ class Pyttsx3TTS(TTSProcessor):
         """
         super().set_speed(speed)
         
-        if self.engine and self.is_initialized:
+        # Convert speed to words per minute (pyttsx3 uses WPM)
+        wpm = int(200 * speed)  # 200 WPM is normal speed
+        self._properties['rate'] = wpm
+        
+        if self.is_initialized:
             try:
-                # Convert speed to words per minute (pyttsx3 uses WPM)
-                wpm = int(200 * speed)  # 200 WPM is normal speed
-                self.engine.setProperty('rate', wpm)
+                self._set_property('rate', wpm)
                 logger.info(f"Speed set to: {speed}x ({wpm} WPM)")
             except Exception as e:
                 logger.error(f"Failed to set speed: {e}")
@@ -186,7 +490,8 @@ class Pyttsx3TTS(TTSProcessor):
         info.update({
             "engine": "pyttsx3",
             "offline": True,
-            "system_voices": True
+            "system_voices": True,
+            "worker_pid": self.engine.pid if self.engine is not None else None
         })
         return info
     
@@ -196,11 +501,13 @@ class Pyttsx3TTS(TTSProcessor):
         """
         if self.engine:
             try:
-                self.engine.stop()
-                del self.engine
-                self.engine = None
+                with self._lock:
+                    self._stop_worker()
             except Exception as e:
                 logger.error(f"Error cleaning up pyttsx3: {e}")
         
+        Pyttsx3TTS._voice_cache = None
+        Pyttsx3TTS._voice_index = {}
+        
         super().cleanup()
         logger.info("pyttsx3 resources cleaned up")
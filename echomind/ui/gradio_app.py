@@ -14,16 +14,132 @@ Features:
 - Responsive design
 """
 
+import itertools
+import os
+import threading
+import time
 import gradio as gr
-import json
-from datetime import datetime
-from typing import List, Dict, Any, Tuple
+import numpy as np
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from pathlib import Path
 
 from echomind.core.orchestrator import AssistantOrchestrator
-from echomind.config import settings, get_config_summary
+from echomind.config import settings
 from loguru import logger
 
+# Custom CSS for better styling
+CUSTOM_CSS = """
+.gradio-container {
+    max-width: 1200px !important;
+    margin: 0 auto !important;
+}
+.chat-container {
+    border-radius: 12px;
+    border: 1px solid #e0e0e0;
+    background: #fafafa;
+}
+.status-panel {
+    background: #f8f9fa;
+    border-radius: 8px;
+    padding: 16px;
+    margin-bottom: 16px;
+}
+.settings-panel {
+    background: #ffffff;
+    border: 1px solid #e0e0e0;
+    border-radius: 8px;
+    padding: 16px;
+}
+"""
+
+# Header with title and description
+HEADER_MD = """
+# 🤖 EchoMind-NLP Assistant
+
+**Your intelligent voice and text assistant with conversation memory**
+
+---
+"""
+
+# Information panel, filled in from settings
+INFO_TMPL = """
+**Version:** 0.1.0
+**Model:** {model}
+**Language:** {language}
+**Memory:** {memory_turns} turns
+
+**Features:**
+✅ Text chat
+✅ Conversation memory
+✅ Command system
+✅ Voice input (STT)
+✅ Voice output (TTS)
+"""
+
+# Settings dropdown choices
+WHISPER_SIZES = ("tiny", "base", "small", "medium", "large-v2")
+LANGS = ("en", "es", "fr", "de", "it", "pt", "ru", "ja", "ko", "zh")
+THEMES = ("light", "dark", "auto")
+
+# Event queue sizing: concurrent text requests, concurrent speech (Whisper/TTS)
+# requests, and how many requests may wait before new ones are rejected
+TEXT_CONCURRENCY = 10
+SPEECH_CONCURRENCY = 2
+QUEUE_MAX_SIZE = 100
+
+# Microphone streaming: seconds between chunks, maximum recording length and
+# concurrent streams; utterances are cut at pauses by speech.audio_utils.StreamBuffer
+VOICE_STREAM_EVERY = 0.3
+VOICE_TIME_LIMIT = 30
+VOICE_STREAM_CONCURRENCY = 4
+
+# Status panel refresh interval, and how long speech info is reused (seconds)
+STATUS_REFRESH_SECONDS = 30.0
+SPEECH_INFO_TTL = 30.0
+
+# Stats line under the status panel, as a bound format method
+STATS_FMT = "**Stats:** {} turns, {} in memory".format
+
+# Conversation exports are written here; created once at import
+EXPORTS_DIR = Path("exports")
+EXPORTS_DIR.mkdir(exist_ok=True)
+
+# Timestamp format for export file names
+TS_FMT = "%Y%m%d_%H%M%S"
+
+# Tokenizer thread pools don't survive forking into server workers
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+
+# Load and run the speech models once at startup instead of on the first voice
+# request; a speech_warmup field on Settings can turn this off
+SPEECH_WARMUP = getattr(settings, "speech_warmup", True)
+
+# One orchestrator (and one set of loaded models) per process
+_orchestrator: Optional[AssistantOrchestrator] = None
+_orchestrator_lock = threading.Lock()
+
+
+def _get_orchestrator() -> AssistantOrchestrator:
+    """
+    Get the process-wide assistant orchestrator, creating it on first use.
+    
+    Rebuilding the interface (reloads, multiple Blocks) reuses the same
+    orchestrator instead of loading the models again. When speech is
+    available and SPEECH_WARMUP is on, the speech models are warmed up in a
+    background thread as soon as the orchestrator exists.
+    
+    Returns:
+        AssistantOrchestrator: Shared orchestrator instance
+    """
+    global _orchestrator
+    if _orchestrator is None:
+        with _orchestrator_lock:
+            if _orchestrator is None:
+                _orchestrator = AssistantOrchestrator()
+                if SPEECH_WARMUP and _orchestrator.speech_enabled:
+                    threading.Thread(target=_orchestrator.warmup, name="echomind-warmup", daemon=True).start()
+    return _orchestrator
+
 
 def create_interface() -> gr.Blocks:
     """
@@ -32,49 +148,18 @@ def create_interface() -> gr.Blocks:
     Returns:
         gr.Blocks: Configured Gradio interface
     """
-    # Initialize the assistant orchestrator
-    orchestrator = AssistantOrchestrator()
-    
-    # Custom CSS for better styling
-    custom_css = """
-    .gradio-container {
-        max-width: 1200px !important;
-        margin: 0 auto !important;
-    }
-    .chat-container {
-        border-radius: 12px;
-        border: 1px solid #e0e0e0;
-        background: #fafafa;
-    }
-    .status-panel {
-        background: #f8f9fa;
-        border-radius: 8px;
-        padding: 16px;
-        margin-bottom: 16px;
-    }
-    .settings-panel {
-        background: #ffffff;
-        border: 1px solid #e0e0e0;
-        border-radius: 8px;
-        padding: 16px;
-    }
-    """
+    # Get the shared assistant orchestrator
+    orchestrator = _get_orchestrator()
     
     with gr.Blocks(
         title="EchoMind-NLP Assistant",
         theme=gr.themes.Soft(),
-        css=custom_css
+        css=CUSTOM_CSS
     ) as demo:
         
         # Header with title and description
         with gr.Row():
-            gr.Markdown("""
-            # 🤖 EchoMind-NLP Assistant
-            
-            **Your intelligent voice and text assistant with conversation memory**
-            
-            ---
-            """)
+            gr.Markdown(HEADER_MD)
         
         # Main content area
         with gr.Row():
@@ -82,8 +167,9 @@ def create_interface() -> gr.Blocks:
             with gr.Column(scale=3):
                 # Status panel
                 with gr.Group(elem_classes=["status-panel"]):
-                    status_text = gr.Markdown("**Status:** Ready to chat")
-                    stats_text = gr.Markdown("**Stats:** 0 turns, 0 in memory")
+                    status_text = gr.Markdown("**Status:** Ready to chat")  # Refreshed by the status timer
+                    stats_text = gr.Markdown(STATS_FMT(0, 0))
+                    action_text = gr.Markdown()  # Output of the export/help/status/time buttons
                 
                 # Chat interface
                 with gr.Group(elem_classes=["chat-container"]):
@@ -109,11 +195,15 @@ def create_interface() -> gr.Blocks:
                     with gr.Row():
                         audio_input = gr.Audio(
                             sources=["microphone"],
-                            type="filepath",
+                            type="numpy",
+                            streaming=True,
                             label="Voice Input",
                             show_label=False
                         )
                         voice_status = gr.Markdown("*Click microphone to record*")
+                        voice_buffer = gr.State(None)  # StreamBuffer of the utterance being recorded
+                        voice_turn = gr.State(None)  # Latest answered utterance, shown by show_voice_turn
+                        last_reply = gr.State("")  # Latest assistant message, for the speak button
                     
                     # Action buttons
                     with gr.Row():
@@ -121,6 +211,9 @@ def create_interface() -> gr.Blocks:
                         clear_btn = gr.Button("Clear Chat", variant="secondary", size="sm")
                         export_btn = gr.Button("Export", variant="secondary", size="sm")
                         tts_btn = gr.Button("🔊 Speak Response", variant="secondary", size="sm")
+                    
+                    # Spoken response, played while later sentences are synthesized
+                    tts_audio = gr.Audio(streaming=True, autoplay=True, show_label=False)
             
             # Right column: Settings and info
             with gr.Column(scale=1):
@@ -130,21 +223,21 @@ def create_interface() -> gr.Blocks:
                     
                     # Model settings
                     model_size = gr.Dropdown(
-                        choices=["tiny", "base", "small", "medium", "large-v2"],
+                        choices=WHISPER_SIZES,
                         value=settings.whisper_model_size,
                         label="Whisper Model Size",
                         info="Larger models = better accuracy, slower speed"
                     )
                     
                     language = gr.Dropdown(
-                        choices=["en", "es", "fr", "de", "it", "pt", "ru", "ja", "ko", "zh"],
+                        choices=LANGS,
                         value=settings.stt_language,
                         label="Language",
                         info="Preferred language for speech recognition"
                     )
                     
                     theme_selector = gr.Dropdown(
-                        choices=["light", "dark", "auto"],
+                        choices=THEMES,
                         value=settings.theme,
                         label="Theme",
                         info="Interface theme preference"
@@ -165,73 +258,60 @@ def create_interface() -> gr.Blocks:
                 with gr.Group(elem_classes=["settings-panel"]):
                     gr.Markdown("### ℹ️ Information")
                     
-                    info_text = gr.Markdown(f"""
-                    **Version:** 0.1.0
-                    **Model:** {settings.whisper_model_size}
-                    **Language:** {settings.stt_language}
-                    **Memory:** {settings.max_conversation_turns} turns
-                    
-                    **Features:**
-                    ✅ Text chat
-                    ✅ Conversation memory
-                    ✅ Command system
-                    ✅ Voice input (STT)
-                    ✅ Voice output (TTS)
-                    """)
+                    info_text = gr.Markdown(INFO_TMPL.format(
+                        model=settings.whisper_model_size,
+                        language=settings.stt_language,
+                        memory_turns=settings.max_conversation_turns
+                    ))
         
         # Event handlers
-        def respond(message: str, history: List[Dict[str, str]]) -> Tuple[List[Dict[str, str]], str]:
+        # Numbers voice turns so voice_turn.change fires even for identical replies
+        voice_turn_ids = itertools.count(1)
+        
+        def respond(message: str, history: List[Dict[str, str]]) -> Iterator[Tuple[List[Dict[str, str]], str, Any, Any]]:
             """
-            Process user message and generate response.
+            Process user message and stream the response into the chat.
             
             Args:
                 message: User's input message
                 history: Current chat history
             
-            Returns:
-                Tuple of (updated_history, empty_string)
+            Yields:
+                Tuples of (updated_history, empty_string, stats_markdown, last_reply)
+                as the reply grows; stats and last_reply are only sent once the
+                reply is complete
             """
             if not message.strip():
-                return history, ""
+                yield history, "", gr.skip(), gr.skip()
+                return
+            
+            history.append({"role": "user", "content": message})
+            history.append({"role": "assistant", "content": ""})
             
             try:
-                # Generate response
-                reply = orchestrator.handle_text(message)
+                # Stream the response into the last message
+                for delta in orchestrator.handle_text_stream(message):
+                    history[-1]["content"] += delta
+                    yield history, "", gr.skip(), gr.skip()
                 
-                # Update history
-                updated_history = history + [
-                    {"role": "user", "content": message},
-                    {"role": "assistant", "content": reply}
-                ]
-                
-                # Update status
+                # Update stats
                 stats = orchestrator.get_conversation_stats()
-                stats_text.value = f"**Stats:** {stats['total_turns']} turns, {stats['memory_turns']} in memory"
-                
-                return updated_history, ""
+                yield history, "", STATS_FMT(stats['total_turns'], stats['memory_turns']), history[-1]["content"]
                 
             except Exception as e:
-                logger.error(f"Error in respond function: {e}")
-                error_msg = f"Sorry, I encountered an error: {str(e)}"
-                updated_history = history + [
-                    {"role": "user", "content": message},
-                    {"role": "assistant", "content": error_msg}
-                ]
-                return updated_history, ""
+                logger.opt(exception=True).error("Error in respond function")
+                history[-1]["content"] = f"Sorry, I encountered an error: {str(e)}"
+                yield history, "", gr.skip(), gr.skip()
         
         def clear_chat() -> Tuple[List[Dict[str, str]], str]:
-            """Clear the chat history."""
-            result = orchestrator.clear_conversation()
-            return [], result
+            """Clear the chat history and the reply kept for the speak button."""
+            orchestrator.clear_conversation()
+            return [], ""
         
         def export_conversation() -> str:
             """Export conversation to JSON file."""
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"conversation_{timestamp}.json"
-            filepath = Path("exports") / filename
-            
-            # Create exports directory if it doesn't exist
-            filepath.parent.mkdir(exist_ok=True)
+            timestamp = time.strftime(TS_FMT)
+            filepath = EXPORTS_DIR / f"conversation_{timestamp}.json"
             
             return orchestrator.export_conversation(str(filepath))
         
@@ -247,124 +327,235 @@ def create_interface() -> gr.Blocks:
             """Show current time."""
             return orchestrator.nlp.commands["time"]()
         
+        # [expiry time, cached info] for get_speech_info
+        speech_info_cache: List[Any] = [0.0, None]
+        
+        def cached_speech_info() -> Dict[str, Any]:
+            """Get speech info, refreshed at most every SPEECH_INFO_TTL seconds."""
+            now = time.monotonic()
+            if now >= speech_info_cache[0]:
+                speech_info_cache[1] = orchestrator.get_speech_info()
+                speech_info_cache[0] = now + SPEECH_INFO_TTL
+            return speech_info_cache[1]
+        
         def update_status() -> str:
             """Update status display."""
             stats = orchestrator.get_conversation_stats()
-            speech_info = orchestrator.get_speech_info()
+            speech_info = cached_speech_info()
             speech_status = "✅" if speech_info["speech_enabled"] else "❌"
             return f"**Status:** Active | **Stats:** {stats['total_turns']} turns, {stats['memory_turns']} in memory | **Speech:** {speech_status}"
         
-        def process_voice_input(audio_data) -> Tuple[List[Dict[str, str]], str, str]:
+        async def finish_utterance(audio: np.ndarray, sample_rate: int) -> Tuple[Any, str]:
             """
-            Process voice input and generate response.
+            Transcribe and answer a finished utterance.
             
             Args:
-                audio_data: Audio data from microphone (filepath)
+                audio: Mono float32 samples of the utterance
+                sample_rate: Sample rate of ``audio`` in Hz
                 
             Returns:
-                Tuple of (updated_history, empty_string, status_message)
+                Tuple of (voice_turn, status_message); voice_turn is skipped on error
             """
-            if audio_data is None:
-                return [], "", "*No audio detected*"
-            
             try:
-                # Read audio file
-                with open(audio_data, 'rb') as f:
-                    audio_bytes = f.read()
-                
-                # Process voice input
-                response = orchestrator.handle_voice_input(audio_bytes)
+                # Process voice input (batched with concurrent requests)
+                response = await orchestrator.handle_voice_input_async(audio, sample_rate=sample_rate)
+                turn = {"id": next(voice_turn_ids), "reply": response}
+                return turn, f"*Processed voice input: {len(response)} chars*"
                 
-                # Update history
-                updated_history = [
-                    {"role": "user", "content": "[Voice Input]"},
-                    {"role": "assistant", "content": response}
-                ]
+            except Exception as e:
+                logger.opt(exception=True).error("Voice processing error")
+                return gr.skip(), f"*Voice processing error: {str(e)}*"
+        
+        async def process_voice_chunk(audio_chunk, buffer: Any) -> Tuple[Any, Any, str]:
+            """
+            Buffer streamed microphone audio and answer once the speaker pauses.
+            
+            The chat is neither sent nor returned here; a finished utterance is
+            handed to show_voice_turn through the voice_turn state.
+            
+            Args:
+                audio_chunk: Latest microphone audio as (sample_rate, samples)
+                buffer: This session's StreamBuffer, or None before the first chunk
                 
-                return updated_history, "", f"*Processed voice input: {len(response)} chars*"
+            Returns:
+                Tuple of (voice_turn, buffer, status_message)
+            """
+            if audio_chunk is None:
+                return gr.skip(), buffer, "*No audio detected*"
+            
+            # Speech modules load on first voice use, as in the orchestrator
+            from echomind.speech.audio_utils import StreamBuffer
+            
+            sample_rate, samples = audio_chunk
+            if buffer is None or buffer.sample_rate != sample_rate:
+                buffer = StreamBuffer(sample_rate)
+            
+            utterance = buffer.push(samples)
+            if utterance is not None:
+                turn, status = await finish_utterance(utterance, sample_rate)
+                return turn, None, status
+            
+            return gr.skip(), buffer, f"*Listening... {buffer.seconds:.1f}s*"
+        
+        async def finish_voice_input(buffer: Any) -> Tuple[Any, Any, str]:
+            """
+            Answer whatever is still buffered when recording stops.
+            
+            Args:
+                buffer: This session's StreamBuffer, or None if nothing is buffered
                 
-            except Exception as e:
-                logger.error(f"Voice processing error: {e}")
-                return [], "", f"*Voice processing error: {str(e)}*"
+            Returns:
+                Tuple of (voice_turn, cleared_buffer, status_message)
+            """
+            utterance = buffer.flush() if buffer is not None else None
+            if utterance is None:
+                return gr.skip(), None, "*Click microphone to record*"
+            
+            turn, status = await finish_utterance(utterance, buffer.sample_rate)
+            return turn, None, status
         
-        def speak_response(text: str) -> str:
+        def show_voice_turn(
+            turn: Optional[Dict[str, Any]],
+            history: List[Dict[str, str]]
+        ) -> Tuple[Any, Any, Any]:
             """
-            Convert text response to speech.
+            Add a finished voice exchange to the chat.
             
             Args:
-                text: Text to speak
+                turn: Latest voice turn from the voice_turn state
+                history: Current chat history
                 
             Returns:
-                Status message
+                Tuple of (updated_history, stats_markdown, last_reply)
+            """
+            if not turn:
+                return gr.skip(), gr.skip(), gr.skip()
+            
+            history.append({"role": "user", "content": "[Voice Input]"})
+            history.append({"role": "assistant", "content": turn["reply"]})
+            
+            stats = orchestrator.get_conversation_stats()
+            return history, STATS_FMT(stats['total_turns'], stats['memory_turns']), turn["reply"]
+        
+        def speak_response(text: str) -> Iterator[Tuple[Any, str]]:
             """
-            if not text.strip():
-                return "*No text to speak*"
+            Speak the last assistant response, streaming audio sentence by sentence.
+            
+            Args:
+                text: Last assistant message, kept in the last_reply state
+                
+            Yields:
+                Tuples of ((sample_rate, samples) audio chunk, status message)
+            """
+            if not text or not text.strip():
+                yield None, "*No text to speak*"
+                return
             
             try:
-                audio_data = orchestrator.synthesize_response(text)
-                if audio_data:
-                    return f"*Synthesized {len(text)} characters to speech*"
+                chunks = 0
+                for audio_chunk in orchestrator.synthesize_stream(text):
+                    chunks += 1
+                    yield audio_chunk, f"*Speaking... ({chunks})*"
+                
+                if chunks:
+                    yield gr.skip(), f"*Synthesized {len(text)} characters to speech*"
                 else:
-                    return "*Speech synthesis failed*"
+                    yield None, "*Speech synthesis failed*"
                     
             except Exception as e:
-                logger.error(f"Speech synthesis error: {e}")
-                return f"*Speech synthesis error: {str(e)}*"
+                logger.opt(exception=True).error("Speech synthesis error")
+                yield None, f"*Speech synthesis error: {str(e)}*"
         
         # Bind event handlers
+        # Text chat shares one bounded pool; speech models share a smaller one;
+        # cheap handlers are unlimited so they never wait behind model calls
         textbox.submit(
             respond,
             inputs=[textbox, chat],
-            outputs=[chat, textbox]
+            outputs=[chat, textbox, stats_text, last_reply],
+            concurrency_limit=TEXT_CONCURRENCY,
+            concurrency_id="llm"
         )
         
         send_btn.click(
             respond,
             inputs=[textbox, chat],
-            outputs=[chat, textbox]
+            outputs=[chat, textbox, stats_text, last_reply],
+            concurrency_limit=TEXT_CONCURRENCY,
+            concurrency_id="llm"
         )
         
         clear_btn.click(
             clear_chat,
-            outputs=[chat]
+            outputs=[chat, last_reply],
+            concurrency_limit=None
         )
         
         export_btn.click(
             export_conversation,
-            outputs=[status_text]
+            outputs=[action_text],
+            concurrency_limit=None
         )
         
         help_btn.click(
             show_help,
-            outputs=[status_text]
+            outputs=[action_text],
+            concurrency_limit=None
         )
         
         status_btn.click(
             show_status,
-            outputs=[status_text]
+            outputs=[action_text],
+            concurrency_limit=None
         )
         
         time_btn.click(
             show_time,
-            outputs=[status_text]
+            outputs=[action_text],
+            concurrency_limit=None
         )
         
-        # Voice input handler
-        audio_input.change(
-            process_voice_input,
-            inputs=[audio_input],
-            outputs=[chat, textbox, voice_status]
+        # Voice input handler; only show_voice_turn reads or writes the chat
+        audio_input.stream(
+            process_voice_chunk,
+            inputs=[audio_input, voice_buffer],
+            outputs=[voice_turn, voice_buffer, voice_status],
+            stream_every=VOICE_STREAM_EVERY,
+            time_limit=VOICE_TIME_LIMIT,
+            concurrency_limit=VOICE_STREAM_CONCURRENCY
+        )
+        
+        audio_input.stop_recording(
+            finish_voice_input,
+            inputs=[voice_buffer],
+            outputs=[voice_turn, voice_buffer, voice_status],
+            concurrency_limit=SPEECH_CONCURRENCY,
+            concurrency_id="speech"
+        )
+        
+        voice_turn.change(
+            show_voice_turn,
+            inputs=[voice_turn, chat],
+            outputs=[chat, stats_text, last_reply],
+            concurrency_limit=None
         )
         
         # TTS handler
         tts_btn.click(
             speak_response,
-            inputs=[chat],  # Get the last response from chat
-            outputs=[voice_status]
+            inputs=[last_reply],
+            outputs=[tts_audio, voice_status],
+            concurrency_limit=SPEECH_CONCURRENCY,
+            concurrency_id="speech"
         )
         
-        # Auto-refresh status every 30 seconds
-        demo.load(update_status, outputs=[status_text])
+        # Show status on page load, then refresh it periodically
+        demo.load(update_status, outputs=[status_text], concurrency_limit=None)
+        status_timer = gr.Timer(STATUS_REFRESH_SECONDS)
+        status_timer.tick(update_status, outputs=[status_text], concurrency_limit=None)
+    
+    # Run handlers on parallel queue workers instead of one at a time
+    demo.queue(default_concurrency_limit=TEXT_CONCURRENCY, max_size=QUEUE_MAX_SIZE)
     
     return demo
 
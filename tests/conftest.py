@@ -0,0 +1,13 @@
+"""
+Test Configuration
+=================
+
+Makes the ``echomind`` package importable when pytest is run from any directory.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
@@ -0,0 +1,315 @@
+"""
+Audio Utilities Tests
+====================
+
+Tests for WAV encoding/decoding, resampling, level processing and stream
+segmentation in echomind.speech.audio_utils.
+"""
+
+import struct
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from echomind.speech import audio_utils
+from echomind.speech.audio_utils import AudioUtils, StreamBuffer
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def make_wav(pcm: bytes, sample_rate: int = 16000, channels: int = 1, extra_chunks: bytes = b"") -> bytes:
+    """Build a 16-bit PCM WAV with optional chunks between 'fmt ' and 'data'."""
+    fmt = struct.pack('<4sIHHIIHH', b'fmt ', 16, 1, channels, sample_rate, sample_rate * 2 * channels, 2 * channels, 16)
+    data = struct.pack('<4sI', b'data', len(pcm)) + pcm
+    body = b'WAVE' + fmt + extra_chunks + data
+    return struct.pack('<4sI', b'RIFF', len(body)) + body
+
+
+@pytest.fixture(params=[True, False], ids=["soundfile", "struct"])
+def writer(request, monkeypatch):
+    """Run a test with both the soundfile and the hand-packed WAV writer."""
+    if request.param and not audio_utils.SOUNDFILE_AVAILABLE:
+        pytest.skip("soundfile is not installed")
+    monkeypatch.setattr(audio_utils, "SOUNDFILE_AVAILABLE", request.param)
+
+
+def test_wav_round_trip(writer):
+    """numpy -> WAV bytes -> numpy preserves the samples to 16-bit precision."""
+    samples = np.sin(np.linspace(0, 20, 1600, dtype=np.float32)) * 0.5
+    
+    wav = AudioUtils.numpy_to_bytes(samples, 16000)
+    decoded = AudioUtils.bytes_to_numpy(wav, 16000)
+    
+    assert decoded.dtype == np.float32
+    assert decoded.shape == samples.shape
+    np.testing.assert_allclose(decoded, samples, atol=1e-4)
+
+
+def test_struct_writer_header_fields(monkeypatch):
+    """The fallback writer emits a 44-byte PCM header with consistent sizes."""
+    monkeypatch.setattr(audio_utils, "SOUNDFILE_AVAILABLE", False)
+    stereo = np.zeros((100, 2), dtype=np.float32)
+    
+    wav = AudioUtils.numpy_to_bytes(stereo, 22050)
+    riff, riff_size, wave, _, _, tag, channels, rate, byte_rate, align, bits, data, data_size = struct.unpack_from(
+        '<4sI4s4sIHHIIHH4sI', wav
+    )
+    
+    assert (riff, wave, data) == (b'RIFF', b'WAVE', b'data')
+    assert (tag, channels, rate, align, bits) == (1, 2, 22050, 4, 16)
+    assert byte_rate == 22050 * 4
+    assert data_size == 400 and riff_size == 36 + 400 and len(wav) == 44 + 400
+
+
+def test_float_samples_are_clipped_not_wrapped(monkeypatch):
+    """Out-of-range floats saturate at full scale in the fallback writer."""
+    monkeypatch.setattr(audio_utils, "SOUNDFILE_AVAILABLE", False)
+    
+    wav = AudioUtils.numpy_to_bytes(np.array([2.0, -2.0, 0.5], dtype=np.float32))
+    
+    assert np.frombuffer(wav, dtype='<i2', offset=44).tolist() == [32767, -32767, 16384]
+
+
+def test_parser_skips_extra_chunks_and_clamps_data_size():
+    """Chunks before 'data' are skipped and a placeholder length is clamped."""
+    pcm = np.array([0, 16384, -16384, 32767], dtype='<i2').tobytes()
+    list_chunk = struct.pack('<4sI', b'LIST', 5) + b'abcde' + b'\x00'  # Odd size, padded
+    wav = bytearray(make_wav(pcm, 8000, extra_chunks=list_chunk))
+    struct.pack_into('<I', wav, len(wav) - len(pcm) - 4, 0xFFFFFFFF)  # Streaming placeholder
+    
+    info = AudioUtils.get_audio_info(bytes(wav))
+    decoded = AudioUtils.bytes_to_numpy(bytes(wav), 8000)
+    
+    assert info["format"] == "WAV"
+    assert info["sample_rate"] == 8000
+    assert info["length_samples"] == 4
+    np.testing.assert_allclose(decoded, [0.0, 0.5, -0.5, 32767 / 32768])
+
+
+def test_stereo_wav_decodes_to_frames_by_channels():
+    """Interleaved stereo PCM comes back shaped (frames, channels)."""
+    pcm = np.array([1, 2, 3, 4, 5, 6], dtype='<i2').tobytes()
+    
+    decoded = AudioUtils.bytes_to_numpy(make_wav(pcm, channels=2), 16000)
+    
+    assert decoded.shape == (3, 2)
+    assert AudioUtils.get_audio_info(make_wav(pcm, channels=2))["channels"] == 2
+
+
+def test_non_wav_bytes_are_not_parsed():
+    """Raw PCM that starts with an MP3 sync word is not taken for a WAV file."""
+    raw = b'\xff\xfb' + bytes(100)
+    
+    assert AudioUtils.validate_audio_format(raw) == "MP3"
+    assert AudioUtils.get_audio_info(raw)["format"] == "unknown"
+
+
+def test_to_mono_float32_scales_signed_pcm():
+    """Signed integer PCM is divided by its full negative range."""
+    pcm = np.array([-32768, 0, 16384], dtype=np.int16)
+    
+    np.testing.assert_array_equal(AudioUtils.to_mono_float32(pcm), [-1.0, 0.0, 0.5])
+
+
+@pytest.mark.parametrize("dtype, samples, expected", [
+    (np.uint8, [0, 128, 255, 64], [-1.0, 0.0, 127 / 128, -0.5]),
+    (np.uint16, [0, 32768, 49152], [-1.0, 0.0, 0.5]),
+])
+def test_to_mono_float32_centres_unsigned_pcm(dtype, samples, expected):
+    """Unsigned PCM is shifted by its midpoint before scaling."""
+    audio = AudioUtils.to_mono_float32(np.array(samples, dtype=dtype))
+    
+    assert audio.dtype == np.float32
+    np.testing.assert_allclose(audio, expected)
+
+
+def test_to_mono_float32_averages_channels():
+    """Multichannel input is averaged to mono."""
+    stereo = np.array([[128, 255], [0, 0]], dtype=np.uint8)
+    
+    np.testing.assert_allclose(AudioUtils.to_mono_float32(stereo), [127 / 256, -1.0])
+
+
+@pytest.fixture(params=["soxr", "scipy", "interp"])
+def resampler(request, monkeypatch):
+    """Run a test with each resampling backend."""
+    if request.param == "soxr" and not audio_utils.SOXR_AVAILABLE:
+        pytest.skip("soxr is not installed")
+    if request.param == "scipy" and not audio_utils.SCIPY_AVAILABLE:
+        pytest.skip("scipy is not installed")
+    monkeypatch.setattr(audio_utils, "SOXR_AVAILABLE", request.param == "soxr")
+    monkeypatch.setattr(audio_utils, "SCIPY_AVAILABLE", request.param == "scipy")
+    return request.param
+
+
+def test_resample_length_and_pitch(resampler):
+    """Resampling scales the length by the rate ratio and keeps a tone's frequency."""
+    rate, target, freq = 48000, 16000, 440
+    t = np.arange(rate, dtype=np.float64) / rate
+    tone = np.sin(2 * np.pi * freq * t).astype(np.float32)
+    
+    out = AudioUtils.resample_audio(tone, rate, target)
+    
+    assert abs(len(out) - target) <= 1
+    spectrum = np.abs(np.fft.rfft(out[:target]))
+    assert int(np.argmax(spectrum)) == pytest.approx(freq, abs=1)
+
+
+def test_resample_keeps_float32(resampler):
+    """Float32 input stays float32 with the soxr and scipy backends."""
+    out = AudioUtils.resample_audio(np.zeros(22050, dtype=np.float32), 22050, 16000)
+    
+    if resampler != "interp":
+        assert out.dtype == np.float32
+
+
+def test_resample_same_rate_is_a_no_op():
+    """Equal rates return the input array itself."""
+    audio = np.ones(10, dtype=np.float32)
+    
+    assert AudioUtils.resample_audio(audio, 16000, 16000) is audio
+
+
+def test_normalize_scales_peak_to_headroom():
+    """The loudest sample, positive or negative, ends up at 0.95."""
+    audio = np.array([0.1, -0.5, 0.25], dtype=np.float32)
+    
+    out = AudioUtils.normalize_audio(audio)
+    
+    np.testing.assert_allclose(out, [0.19, -0.95, 0.475], rtol=1e-6)
+    assert out is not audio
+    assert audio[1] == np.float32(-0.5)
+
+
+def test_normalize_in_place_reuses_float_buffers():
+    """in_place=True scales a float buffer in place but never an integer one."""
+    audio = np.array([0.0, 0.2, -0.1], dtype=np.float32)
+    pcm = np.array([0, 1000, -500], dtype=np.int16)
+    
+    out = AudioUtils.normalize_audio(audio, in_place=True)
+    scaled = AudioUtils.normalize_audio(pcm, in_place=True)
+    
+    assert out is audio and out[1] == pytest.approx(0.95)
+    assert scaled is not pcm and scaled[1] == pytest.approx(0.95)
+    assert pcm[1] == 1000
+
+
+def test_normalize_leaves_silence_and_empty_input():
+    """All-zero and empty arrays are returned unchanged."""
+    silence = np.zeros(4, dtype=np.float32)
+    empty = np.zeros(0, dtype=np.float32)
+    
+    assert AudioUtils.normalize_audio(silence) is silence
+    assert AudioUtils.normalize_audio(empty) is empty
+
+
+def test_trim_silence_cuts_quiet_edges():
+    """Samples below the threshold are removed from both ends only."""
+    audio = np.array([0.0, 0.005, 0.5, 0.0, -0.25, 0.001, 0.0], dtype=np.float32)
+    
+    np.testing.assert_array_equal(AudioUtils.trim_silence(audio), [0.5, 0.0, -0.25])
+
+
+def test_trim_silence_threshold_is_inclusive():
+    """A sample exactly at the threshold counts as sound."""
+    audio = np.array([0.0, 0.01, 0.0], dtype=np.float32)
+    
+    assert AudioUtils.trim_silence(audio, threshold=np.float32(0.01)).tolist() == [np.float32(0.01)]
+
+
+def test_trim_silence_keeps_all_silent_and_empty_audio():
+    """With no loud sample there is nothing to trim against."""
+    silence = np.zeros(5, dtype=np.float32)
+    empty = np.zeros(0, dtype=np.float32)
+    
+    assert AudioUtils.trim_silence(silence) is silence
+    assert AudioUtils.trim_silence(empty) is empty
+
+
+def test_trim_silence_multichannel_uses_any_channel():
+    """A frame is loud if any of its channels is loud."""
+    stereo = np.zeros((6, 2), dtype=np.float32)
+    stereo[2, 1] = 0.4
+    stereo[4, 0] = -0.4
+    
+    assert AudioUtils.trim_silence(stereo).shape == (3, 2)
+
+
+@pytest.mark.parametrize("audio", [
+    np.array([0.0, 0.005, 0.5, 0.0, -0.25, 0.001, 0.0], dtype=np.float32),
+    np.array([0.0, 0.01, 0.0], dtype=np.float32),
+    np.zeros(5, dtype=np.float64),
+    np.array([0.9], dtype=np.float32),
+])
+def test_numba_trim_matches_numpy(audio):
+    """The optional compiled scan trims exactly like the NumPy path."""
+    pytest.importorskip("numba")
+    
+    expected = AudioUtils.trim_silence(audio, threshold=0.01)
+    
+    np.testing.assert_array_equal(AudioUtils.trim_silence(audio, threshold=0.01, use_numba=True), expected)
+
+
+def test_optional_backends_are_not_imported_eagerly():
+    """Importing audio_utils loads neither numba nor scipy."""
+    code = (
+        "import sys, echomind.speech.audio_utils; "
+        "print(sorted(m for m in ('numba', 'scipy') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+    
+    assert result.stdout.strip() == "[]"
+
+
+def test_stream_buffer_cuts_at_a_pause_after_speech():
+    """An utterance is returned once enough speech is followed by a pause."""
+    rate = 1000
+    buffer = StreamBuffer(rate, min_speech_seconds=0.5, pause_seconds=0.6)
+    speech = np.full(300, 0.5, dtype=np.float32)
+    silence = np.zeros(300, dtype=np.float32)
+    
+    results = [buffer.push(chunk) for chunk in (speech, speech, silence, silence)]
+    
+    assert results[:3] == [None, None, None]
+    assert results[3].size == 1200
+    assert buffer.seconds == 0.0
+
+
+def test_stream_buffer_ignores_short_blips_and_silence():
+    """A pause after too little speech does not end an utterance."""
+    buffer = StreamBuffer(1000, min_speech_seconds=0.5, pause_seconds=0.2)
+    
+    assert buffer.push(np.full(100, 0.5, dtype=np.float32)) is None
+    assert buffer.push(np.zeros(300, dtype=np.float32)) is None
+    
+    silent = StreamBuffer(1000)
+    silent.push(np.zeros(500, dtype=np.float32))
+    assert silent.flush() is None
+
+
+def test_stream_buffer_cuts_at_max_and_keeps_tail():
+    """Continuous speech is cut at max_seconds, keeping tail_seconds as context."""
+    buffer = StreamBuffer(1000, max_seconds=1.0, tail_seconds=0.2)
+    speech = np.full(500, 0.5, dtype=np.float32)
+    
+    assert buffer.push(speech) is None
+    window = buffer.push(speech)
+    
+    assert window.size == 1000
+    assert buffer.seconds == pytest.approx(0.2)
+
+
+def test_stream_buffer_flush_returns_pending_speech():
+    """flush() hands back buffered speech and leaves the buffer empty."""
+    buffer = StreamBuffer(1000)
+    buffer.push(np.full(200, 16000, dtype=np.int16))  # Integer PCM is scaled to float
+    
+    audio = buffer.flush()
+    
+    assert audio.dtype == np.float32 and audio.size == 200
+    assert buffer.flush() is None
@@ -0,0 +1,117 @@
+"""
+Dynamic Batcher Tests
+====================
+
+Tests for grouping concurrent requests in echomind.core.batcher.
+"""
+
+import asyncio
+
+import pytest
+
+from echomind.core.batcher import AsyncBatcher
+
+
+def run(coro):
+    """Run a coroutine on a fresh event loop."""
+    return asyncio.run(coro)
+
+
+def test_concurrent_requests_share_one_batch():
+    """Requests submitted together are processed in a single call, in order."""
+    calls = []
+    
+    def process(items):
+        calls.append(list(items))
+        return [item * 2 for item in items]
+    
+    async def main():
+        batcher = AsyncBatcher(process, max_batch_size=8, max_wait_ms=50)
+        return await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+    
+    assert run(main()) == [0, 2, 4, 6, 8]
+    assert calls == [[0, 1, 2, 3, 4]]
+
+
+def test_batches_respect_max_batch_size():
+    """No batch is larger than max_batch_size and every request is answered."""
+    calls = []
+    
+    def process(items):
+        calls.append(len(items))
+        return items
+    
+    async def main():
+        batcher = AsyncBatcher(process, max_batch_size=2, max_wait_ms=20)
+        return await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+    
+    assert run(main()) == [0, 1, 2, 3, 4]
+    assert max(calls) <= 2
+    assert sum(calls) == 5
+
+
+def test_failed_batch_fails_its_requests():
+    """An exception in the batch function reaches every request of that batch."""
+    def process(items):
+        raise ValueError("model crashed")
+    
+    async def main():
+        batcher = AsyncBatcher(process, max_batch_size=4, max_wait_ms=20)
+        return await asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True)
+    
+    results = run(main())
+    assert len(results) == 3
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_wrong_result_count_is_an_error():
+    """A batch function returning the wrong number of results fails the batch."""
+    async def main():
+        batcher = AsyncBatcher(lambda items: items[:1], max_batch_size=4, max_wait_ms=20)
+        return await asyncio.gather(batcher.submit("a"), batcher.submit("b"))
+    
+    with pytest.raises(RuntimeError):
+        run(main())
+
+
+def test_batcher_recovers_after_failure():
+    """A failed batch does not stop later requests from being processed."""
+    def process(items):
+        if "bad" in items:
+            raise ValueError("bad input")
+        return [item.upper() for item in items]
+    
+    async def main():
+        batcher = AsyncBatcher(process, max_batch_size=4, max_wait_ms=5)
+        with pytest.raises(ValueError):
+            await batcher.submit("bad")
+        return await batcher.submit("good")
+    
+    assert run(main()) == "GOOD"
+
+
+def test_batcher_follows_the_running_loop():
+    """A batcher used on one loop keeps working when called from another loop."""
+    batcher = AsyncBatcher(lambda items: [item + 1 for item in items], max_batch_size=4, max_wait_ms=5)
+    first_loop = asyncio.new_event_loop()
+    second_loop = asyncio.new_event_loop()
+    
+    try:
+        # The first loop is left open with its worker still pending, as a server loop would be
+        assert first_loop.run_until_complete(batcher.submit(1)) == 2
+        assert second_loop.run_until_complete(asyncio.wait_for(batcher.submit(2), timeout=2)) == 3
+        assert first_loop.run_until_complete(asyncio.wait_for(batcher.submit(3), timeout=2)) == 4
+    finally:
+        for loop in (first_loop, second_loop):
+            for task in asyncio.all_tasks(loop):
+                task.cancel()
+            loop.run_until_complete(asyncio.sleep(0))
+            loop.close()
+
+
+def test_batcher_works_across_asyncio_run_calls():
+    """Each asyncio.run gets a fresh queue and worker."""
+    batcher = AsyncBatcher(lambda items: items, max_batch_size=2, max_wait_ms=5)
+    
+    assert run(batcher.submit("a")) == "a"
+    assert run(batcher.submit("b")) == "b"
@@ -0,0 +1,97 @@
+"""
+Conversation Memory Tests
+========================
+
+Tests for the rolling conversation window in echomind.core.memory.
+"""
+
+import threading
+
+from echomind.core.memory import ConversationMemory
+
+
+def test_turns_are_stored_in_order_and_stripped():
+    """Turns come back as (user, assistant) pairs in insertion order."""
+    memory = ConversationMemory(max_turns=5)
+    memory.add_turn("  hello ", " hi there ")
+    memory.add_turn("how are you", "fine")
+    
+    assert memory.as_list() == [("hello", "hi there"), ("how are you", "fine")]
+    assert memory.count() == 2
+
+
+def test_empty_turns_are_skipped():
+    """A turn with a blank side is not stored."""
+    memory = ConversationMemory()
+    memory.add_turn("   ", "reply")
+    memory.add_turn("question", "")
+    
+    assert memory.is_empty()
+
+
+def test_oldest_turns_are_evicted_in_pairs():
+    """Past max_turns, the oldest user and assistant texts leave together."""
+    memory = ConversationMemory(max_turns=3)
+    for i in range(5):
+        memory.add_turn(f"user {i}", f"assistant {i}")
+    
+    assert memory.as_list() == [(f"user {i}", f"assistant {i}") for i in range(2, 5)]
+
+
+def test_context_numbers_the_most_recent_turns():
+    """get_context(max_turns) numbers only the last turns, starting at 1."""
+    memory = ConversationMemory()
+    for i in range(4):
+        memory.add_turn(f"u{i}", f"a{i}")
+    
+    assert memory.get_context(max_turns=2) == "Turn 1:\nUser: u2\nAssistant: a2\n\nTurn 2:\nUser: u3\nAssistant: a3"
+    assert memory.get_context().startswith("Turn 1:\nUser: u0")
+
+
+def test_context_cache_is_invalidated_by_changes():
+    """A cached context is rebuilt after add_turn and clear."""
+    memory = ConversationMemory()
+    memory.add_turn("first", "one")
+    before = memory.get_context()
+    assert memory.get_context() is before  # Served from the cache
+    
+    memory.add_turn("second", "two")
+    assert "second" in memory.get_context()
+    
+    memory.clear()
+    assert memory.get_context() == ""
+
+
+def test_concurrent_turns_stay_aligned():
+    """Turns added from many threads never mix up user and assistant texts."""
+    memory = ConversationMemory(max_turns=50)
+    
+    def worker(k):
+        for i in range(500):
+            memory.add_turn(f"{k}-{i}", f"{k}-{i}")
+            memory.get_context(max_turns=3)
+    
+    threads = [threading.Thread(target=worker, args=(k,)) for k in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert memory.count() == 50
+    assert all(user == assistant for user, assistant in memory.as_list())
+
+
+def test_save_and_load_round_trip(tmp_path):
+    """A saved conversation loads back with the same turns and window size."""
+    memory = ConversationMemory(max_turns=4)
+    memory.add_turn("hello", "hi")
+    memory.add_turn("bye", "see you")
+    path = tmp_path / "conversation.json"
+    memory.save_to_file(str(path))
+    
+    restored = ConversationMemory()
+    restored.load_from_file(str(path))
+    
+    assert restored.as_list() == memory.as_list()
+    assert restored.max_turns == 4
+    assert restored.get_context() == memory.get_context()
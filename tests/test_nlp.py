@@ -0,0 +1,136 @@
+"""
+NLP Processor Tests
+==================
+
+Tests for text analysis and rule-based responses in echomind.core.nlp.
+"""
+
+import pytest
+
+from echomind.core.nlp import LANGUAGE_HINT_CLASSES, NLPProcessor, _LANGUAGE_HINT_RE, _char_languages
+
+
+@pytest.fixture
+def nlp():
+    """Fresh NLP processor with an empty analysis cache."""
+    return NLPProcessor()
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("I love this, it is great", "positive"),
+    ("This is awful and I hate it", "negative"),
+    ("Good news, bad news", "neutral"),
+    ("Nothing to report", "neutral"),
+    ("GREAT!!! Wonderful.", "positive"),
+])
+def test_sentiment_counts_lexicon_words(nlp, text, expected):
+    """Sentiment compares positive and negative lexicon hits, ignoring case and punctuation."""
+    assert nlp.analyze(text)["sentiment"] == expected
+
+
+@pytest.mark.parametrize("text", [
+    "The badge is goodish",
+    "A likely unlikeable sadness",
+    "Glove and badminton",
+])
+def test_sentiment_matches_whole_words_only(nlp, text):
+    """Lexicon words inside longer words do not count."""
+    assert nlp.analyze(text)["sentiment"] == "neutral"
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("plain ascii text", []),
+    ("Привет, как дела?", ["russian"]),
+    ("¿Qué tal, señor?", ["spanish", "french"]),
+    ("Straße", ["german"]),
+    ("À bientôt, garçon", ["french"]),
+    ("Über", ["spanish", "french", "german"]),
+])
+def test_language_hints(nlp, text, expected):
+    """Hints list every language whose characters appear, in LANGUAGE_HINT_CLASSES order."""
+    assert nlp.analyze(text)["language_hints"] == expected
+
+
+def test_hint_scan_covers_every_language_class():
+    """Every character of every class is found by the combined scan and mapped back to its language."""
+    for lang, chars in LANGUAGE_HINT_CLASSES.items():
+        sample = chars.replace("а-я", "абвя")
+        for char in sample:
+            assert _LANGUAGE_HINT_RE.fullmatch(char)
+            assert lang in _char_languages(char)
+    
+    assert _char_languages("é") == ("spanish", "french")
+    assert _char_languages("É") == ("spanish", "french")
+    assert _LANGUAGE_HINT_RE.findall("ÑANDÚ Ж") == ["Ñ", "Ú", "Ж"]
+
+
+def test_analyze_returns_a_fresh_copy_of_the_cached_result(nlp):
+    """Mutating one analyze() result does not leak into the memoized analysis."""
+    first = nlp.analyze("  Hola señor!  ")
+    first["word_count"] = -1
+    first["language_hints"].append("klingon")
+    
+    second = nlp.analyze("Hola señor!")
+    
+    assert second is not first
+    assert second["word_count"] == 2
+    assert second["language_hints"] == ["spanish"]
+    assert second["has_exclamation"] and not second["has_question"]
+    assert nlp._analyze_cached.cache_info().hits == 1
+
+
+def test_analysis_caches_are_per_instance():
+    """Each processor memoizes its own analyses."""
+    first, second = NLPProcessor(), NLPProcessor()
+    first.analyze("hello there")
+    
+    assert second._analyze_cached.cache_info().currsize == 0
+
+
+@pytest.mark.parametrize("text", ["/help", "help", "/HELP", "  Help  "])
+def test_commands_work_with_or_without_slash(nlp, text):
+    """A single optional leading slash and any case select the same handler."""
+    assert nlp.generate(text).startswith("**EchoMind-NLP Assistant Help**")
+    assert nlp.analyze(text)["is_command"]
+
+
+@pytest.mark.parametrize("text", ["//help", "/help me", "helpful", "/unknown"])
+def test_non_commands_are_echoed(nlp, text):
+    """Only an exact command name (after removing one slash) is dispatched."""
+    assert not nlp.analyze(text)["is_command"]
+    assert nlp.generate(text).startswith(f'You said: "{text}"')
+
+
+def test_unknown_command_message(nlp):
+    """_process_command reports names missing from the command table."""
+    assert nlp._process_command("/nope") == "Unknown command: /nope"
+
+
+@pytest.mark.parametrize("prompt, suffix", [
+    ("hi", " Short and sweet!"),
+    ("a medium sized line", ""),
+    ("x" * 51, " That's quite a detailed message!"),
+])
+def test_reply_suffix_by_length(nlp, prompt, suffix):
+    """Short and long prompts get their note; medium prompts get none."""
+    assert nlp.generate(prompt) == f'You said: "{prompt}"' + suffix
+
+
+def test_reply_suffix_with_context(nlp):
+    """With context the context note comes before the length note."""
+    reply = nlp.generate("hi", context="Turn 1:\nUser: hello")
+    
+    assert reply == (
+        'You said: "hi" '
+        + nlp.response_templates["context_available"]
+        + " Short and sweet!"
+    )
+
+
+def test_suffix_table_covers_every_case(nlp):
+    """The precomputed table has one entry per (has_context, length class) pair."""
+    assert set(nlp._response_suffixes) == {
+        (has_context, length_class)
+        for has_context in (False, True)
+        for length_class in ("short", "medium", "long")
+    }
@@ -0,0 +1,89 @@
+"""
+Voice Pipeline Tests
+===================
+
+Tests for the overlapping STT → NLP → TTS stages in echomind.core.pipeline.
+"""
+
+import asyncio
+
+from echomind.core.pipeline import VoicePipeline
+
+
+def run(coro):
+    """Run a coroutine on a fresh event loop, failing instead of hanging."""
+    return asyncio.run(asyncio.wait_for(coro, timeout=5))
+
+
+async def collect(pipeline, clips):
+    """Submit every clip, finish the input and gather all results."""
+    await pipeline.start()
+    for clip in clips:
+        await pipeline.submit(clip)
+    await pipeline.finish()
+    return [result async for result in pipeline.results()]
+
+
+def test_results_arrive_in_submission_order():
+    """Every utterance goes through all three stages and keeps its position."""
+    pipeline = VoicePipeline(
+        transcribe=lambda clip: clip.decode(),
+        respond=str.upper,
+        synthesize=lambda reply: reply.encode()
+    )
+    
+    results = run(collect(pipeline, [b"one", b"two", b"three"]))
+    
+    assert [r["transcript"] for r in results] == ["one", "two", "three"]
+    assert [r["reply"] for r in results] == ["ONE", "TWO", "THREE"]
+    assert [r["audio"] for r in results] == [b"ONE", b"TWO", b"THREE"]
+    assert all(r["error"] is None for r in results)
+
+
+def test_failing_stage_reports_the_error_and_keeps_going():
+    """A failed utterance is delivered with its error; the stream does not stall."""
+    def respond(transcript):
+        if transcript == "bad":
+            raise ValueError("model crashed")
+        return transcript.upper()
+    
+    synthesized = []
+    pipeline = VoicePipeline(
+        transcribe=lambda clip: clip.decode(),
+        respond=respond,
+        synthesize=lambda reply: synthesized.append(reply) or b"x"
+    )
+    
+    results = run(collect(pipeline, [b"good", b"bad", b"fine"]))
+    
+    assert [r["reply"] for r in results] == ["GOOD", "", "FINE"]
+    assert isinstance(results[1]["error"], ValueError)
+    assert results[1]["audio"] == b""
+    assert synthesized == ["GOOD", "FINE"]
+
+
+def test_close_cancels_the_stage_tasks():
+    """Closing a pipeline that still expects input stops every stage task."""
+    async def main():
+        pipeline = VoicePipeline(transcribe=str, respond=str)
+        await pipeline.start()
+        await pipeline.submit("hello")
+        first = await pipeline.results().__anext__()
+        await pipeline.close()
+        return first, pipeline._tasks
+    
+    first, tasks = run(main())
+    
+    assert first["reply"] == "hello"
+    assert all(task.done() for task in tasks)
+
+
+def test_consumer_is_released_when_a_stage_is_cancelled():
+    """If a stage dies, results() ends instead of waiting forever."""
+    async def main():
+        pipeline = VoicePipeline(transcribe=str, respond=str)
+        await pipeline.start()
+        pipeline._tasks[1].cancel()
+        return [result async for result in pipeline.results()]
+    
+    assert run(main()) == []
@@ -0,0 +1,51 @@
+"""
+Faster-Whisper STT Tests
+=======================
+
+Tests for echomind.speech.stt_fasterwhisper that don't need a Whisper model.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from echomind.speech.stt_fasterwhisper import FasterWhisperSTT
+
+EOT = 50257
+
+
+class CharTokenizer:
+    """Tokenizer stand-in mapping token ids to characters."""
+    eot = EOT
+    
+    def decode(self, tokens):
+        return "".join(chr(token) for token in tokens)
+
+
+def make_result(text, avg_logprob, no_speech_prob):
+    """Generation result whose normalized score comes out as ``avg_logprob``."""
+    sequence = [ord(c) for c in text] + [EOT]
+    score = avg_logprob * (len(sequence) + 1) / len(sequence)
+    return SimpleNamespace(sequences_ids=[sequence], scores=[score], no_speech_prob=no_speech_prob)
+
+
+@pytest.mark.parametrize("avg_logprob, no_speech_prob, expected", [
+    (-0.3, 0.1, "hello there"),   # Confident speech
+    (-0.3, 0.9, "hello there"),   # Likely silence, but the text is confident
+    (-1.5, 0.9, ""),              # Silence
+    (-1.0, 0.9, ""),              # Threshold is inclusive, as in faster-whisper
+    (-1.5, 0.1, None),            # Low confidence speech: re-transcribe
+])
+def test_batch_result_checks(avg_logprob, no_speech_prob, expected):
+    """Batched results get faster-whisper's no-speech and log-probability checks."""
+    result = make_result("hello there", avg_logprob, no_speech_prob)
+    
+    assert FasterWhisperSTT._checked_batch_text(result, CharTokenizer()) == expected
+
+
+def test_repetitive_batch_result_is_retried():
+    """Highly compressible (looping) text is sent back for temperature fallback."""
+    result = make_result("thank you " * 20, -0.2, 0.0)
+    
+    assert FasterWhisperSTT._checked_batch_text(result, CharTokenizer()) is None
+
@@ -0,0 +1,67 @@
+"""
+Time Utilities Tests
+===================
+
+Tests for the per-second cached time strings in echomind.core.time_utils.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from echomind.core import time_utils
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.time() for time_utils; set clock.now to move it."""
+    class Clock:
+        now = 1_700_000_000.25
+    
+    monkeypatch.setattr(time_utils.time, "time", lambda: Clock.now)
+    monkeypatch.setattr(time_utils, "_now_cache", [0, ""])
+    monkeypatch.setattr(time_utils, "_iso_cache", [0, ""])
+    return Clock
+
+
+def test_now_str_format(clock):
+    """now_str() is the local time as YYYY-MM-DD HH:MM:SS."""
+    expected = datetime.fromtimestamp(1_700_000_000).strftime('%Y-%m-%d %H:%M:%S')
+    
+    assert time_utils.now_str() == expected
+
+
+def test_iso_now_format(clock):
+    """iso_now() is the local time in ISO 8601 with whole seconds."""
+    assert time_utils.iso_now() == datetime.fromtimestamp(1_700_000_000).isoformat()
+    assert "." not in time_utils.iso_now()
+
+
+def test_strings_are_reused_within_a_second(clock):
+    """Calls in the same second return the cached string object."""
+    first_now, first_iso = time_utils.now_str(), time_utils.iso_now()
+    clock.now += 0.5
+    
+    assert time_utils.now_str() is first_now
+    assert time_utils.iso_now() is first_iso
+
+
+def test_strings_refresh_on_the_next_second(clock):
+    """Crossing a second boundary formats a new string."""
+    first_now, first_iso = time_utils.now_str(), time_utils.iso_now()
+    clock.now += 1
+    
+    assert time_utils.now_str() != first_now
+    assert time_utils.iso_now() != first_iso
+    assert time_utils.iso_now() == datetime.fromtimestamp(1_700_000_001).isoformat()
+
+
+def test_real_clock_matches_datetime():
+    """Without patching, both helpers agree with datetime.now() to the second."""
+    before = datetime.now().replace(microsecond=0)
+    stamp = datetime.fromisoformat(time_utils.iso_now())
+    text = datetime.strptime(time_utils.now_str(), '%Y-%m-%d %H:%M:%S')
+    after = datetime.now().replace(microsecond=0)
+    
+    assert before <= stamp <= after
+    assert before <= text <= after
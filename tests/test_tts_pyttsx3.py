@@ -0,0 +1,53 @@
+"""
+pyttsx3 TTS Tests
+================
+
+Tests for echomind.speech.tts_pyttsx3 that don't need a speech engine.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from echomind.speech import tts_pyttsx3
+from echomind.speech.tts_pyttsx3 import JOB_TIMEOUT, Pyttsx3TTS
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_say_timeout_grows_with_text_length():
+    """Long texts get proportionally more time than the base job timeout."""
+    tts = Pyttsx3TTS()
+    
+    assert tts._say_timeout("") == JOB_TIMEOUT
+    assert tts._say_timeout("x" * 1000) == JOB_TIMEOUT + 1000 * tts_pyttsx3.SAY_SECONDS_PER_CHAR
+    assert tts._say_timeout("x" * 2000) > tts._say_timeout("x" * 1000)
+
+
+def test_say_timeout_allows_more_for_slow_speech():
+    """Slower speech rates get a longer timeout for the same text."""
+    text = "x" * 500
+    
+    assert Pyttsx3TTS(speed=0.5)._say_timeout(text) > Pyttsx3TTS(speed=2.0)._say_timeout(text)
+
+
+def test_worker_module_imports_no_other_speech_modules():
+    """Importing tts_pyttsx3, as the spawned worker does, skips STT and audio dependencies."""
+    code = (
+        "import sys, echomind.speech.tts_pyttsx3; "
+        "print(sorted(m for m in sys.modules "
+        "if m.startswith('echomind.') or m.split('.')[0] in ('numpy', 'scipy', 'numba', 'soxr')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+    
+    assert result.stdout.strip() == "['echomind.speech', 'echomind.speech.tts_base', 'echomind.speech.tts_pyttsx3']"
+
+
+def test_package_exports_resolve_lazily():
+    """Public names of echomind.speech are still importable from the package."""
+    from echomind.speech import AudioUtils, TTSProcessor
+    
+    assert AudioUtils.__module__ == "echomind.speech.audio_utils"
+    assert TTSProcessor.__module__ == "echomind.speech.tts_base"
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Voice Features Tests
+===================
+
+These tests check the voice processing capabilities of EchoMind-NLP.
+They verify that STT and TTS are working correctly.
+
+All tests share one session-scoped orchestrator, so the speech models are
+loaded once for the whole run rather than once per test.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+
+import pytest
+
+# The orchestrator reads echomind.config; skip cleanly where it isn't available
+pytest.importorskip("echomind.config")
+
+from echomind.core.orchestrator import AssistantOrchestrator
+
+
+@pytest.fixture(scope="session")
+def orchestrator():
+    """Shared assistant orchestrator for the whole test session."""
+    return AssistantOrchestrator()
+
+
+@pytest.fixture(scope="session")
+def speech_info(orchestrator):
+    """Speech capabilities reported by the shared orchestrator."""
+    return orchestrator.get_speech_info()
+
+
+def test_speech_info(speech_info):
+    """Speech info reports availability and details of each engine."""
+    assert isinstance(speech_info["speech_enabled"], bool)
+    
+    if "stt_info" in speech_info:
+        assert speech_info["stt_info"]["model_size"]
+        assert speech_info["stt_info"]["language"]
+    
+    if "tts_info" in speech_info:
+        assert speech_info["tts_info"]["engine"]
+        assert isinstance(speech_info["tts_info"]["available_voices"], list)
+
+
+def test_speech_info_does_not_load_processors(orchestrator):
+    """Reporting speech status leaves the lazy processors uncreated."""
+    fresh = type(orchestrator)()
+    
+    fresh.get_speech_info()
+    
+    assert fresh._speech_processors == {}
+
+
+def test_speech_processor_is_created_once_across_threads(orchestrator):
+    """Threads racing for a processor (e.g. warmup and a request) share one instance."""
+    fresh = type(orchestrator)()
+    fresh.speech_enabled = True
+    created = []
+    
+    def create():
+        time.sleep(0.05)  # Widen the race window
+        created.append(object())
+        return created[-1]
+    
+    fresh._create_stt_processor = create
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(fresh.stt_processor)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert len(created) == 1
+    assert all(result is created[0] for result in results)
+
+
+def test_text_roundtrip(orchestrator):
+    """A text message gets a reply that is stored as the latest turn."""
+    turns_before = orchestrator.get_system_status()["total_turns"]
+    
+    response = orchestrator.handle_text("Hello, this is a test message.")
+    
+    assert response
+    assert orchestrator.get_system_status()["total_turns"] == turns_before + 1
+    assert orchestrator.memory.as_list()[-1] == ("Hello, this is a test message.", response.strip())
+
+
+def test_streamed_reply_matches_stored_turn(orchestrator):
+    """The streamed deltas join to the reply that ends up in memory."""
+    reply = "".join(orchestrator.handle_text_stream("Tell me something"))
+    
+    assert orchestrator.memory.as_list()[-1] == ("Tell me something", reply.strip())
+
+
+def test_concurrent_async_turns_are_all_recorded(orchestrator):
+    """Batched text requests each get their own reply and memory turn, in order."""
+    messages = [f"batched message {i}" for i in range(4)]
+    turns_before = orchestrator.total_turns
+    
+    async def main():
+        return await asyncio.gather(*(orchestrator.handle_text_async(m) for m in messages))
+    
+    replies = asyncio.run(main())
+    
+    assert len(replies) == 4 and all(replies)
+    assert orchestrator.total_turns == turns_before + 4
+    assert [user for user, _ in orchestrator.memory.as_list()[-4:]] == messages
+
+
+def test_blank_text_is_not_recorded(orchestrator):
+    """Blank input gets a prompt back and does not create a turn."""
+    turns_before = orchestrator.total_turns
+    
+    assert orchestrator.handle_text("   ") == "Please provide some text to process."
+    assert orchestrator.total_turns == turns_before
+
+
+def test_stream_voice_stops_its_tasks_when_the_consumer_leaves(orchestrator):
+    """Closing the stream_voice generator early cancels the feeder and pipeline stages."""
+    class EchoSTT:
+        def transcribe(self, clip):
+            return clip.decode()
+    
+    fresh = type(orchestrator)()
+    fresh._speech_processors["stt"] = EchoSTT()
+    fresh.speech_enabled = True
+    
+    async def clips():
+        yield b"hello"
+        yield b"how are you"
+        await asyncio.sleep(60)
+    
+    async def main():
+        before = asyncio.all_tasks()
+        stream = fresh.stream_voice(clips(), synthesize=False)
+        first = await stream.__anext__()
+        await stream.aclose()
+        return first, asyncio.all_tasks() - before
+    
+    first, leftover = asyncio.run(main())
+    
+    assert first["transcript"] == "hello"
+    assert first["error"] is None
+    assert leftover == set()
+
+
+def test_tts_bytes(orchestrator, speech_info):
+    """Text-to-speech produces audio bytes when an engine is available."""
+    if not speech_info["tts_available"]:
+        pytest.skip("Text-to-speech is not available")
+    
+    audio_data = orchestrator.synthesize_response("Hello, this is a test of text-to-speech.")
+    
+    assert isinstance(audio_data, bytes) and audio_data
+
+
+def test_system_status(orchestrator):
+    """System status exposes turn counts and voice capability."""
+    status = orchestrator.get_system_status()
+    
+    assert status["total_turns"] >= 0
+    assert status["memory_turns"] >= 0
+    assert isinstance(status["system_info"]["capabilities"]["voice_processing"], bool)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-x"]))